@@ -2,21 +2,44 @@
 
 from browser_use import Browser
 import asyncio
+import base64
+import heapq
 import os
-import re
 import json
+import logging
+import re
 import sys
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
+
+# Fast JSON decoding for captured responses and encoding of the output file
+# (optional, falls back to stdlib json)
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_pretty(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
 
+# Response handlers log through here; configured once in __main__ (LOG_LEVEL env var)
+logger = logging.getLogger(__name__)
 
 # Google Play Vitals imports (optional)
 try:
     import google.auth
     from google.auth.transport.requests import Request
     from google.oauth2 import service_account
-    import requests
+    import aiohttp
     from collections import defaultdict
-    import time
     GOOGLE_PLAY_AVAILABLE = True
 except ImportError:
     GOOGLE_PLAY_AVAILABLE = False
@@ -25,72 +48,98 @@ except ImportError:
 # APP CONFIGURATION
 # ============================================================================
 # Configure all apps here with their Firebase and Google Play details
-APPS_CONFIG = {
-    "partner": {
-        "name": "Partner App",
-        "firebase_project": "driverapp-f56a2",
-        "android": {
-            "app_id": "android:com.theporter.android.driverapp",
-            "package_name": "com.theporter.android.driverapp",
-            "play_console": {
-                "developer_id": "4707055851875633325",
-                "app_id": "4972278085731896191"
-            }
-        },
-        "has_ios": False,
-        "has_p90_launch_time": True
-    },
-    "customer": {
-        "name": "Customer App",
-        "firebase_project": "portercustomerapp",
-        "android": {
-            "app_id": "android:com.theporter.android.customerapp",
-            "package_name": "com.theporter.android.customerapp",
-            "play_console": {
-                "developer_id": "4707055851875633325",
-                "app_id": "4975635893417729870"
-            }
-        },
-        "ios": {
-            "app_id": "ios:in.theporter.customerapp",
-            "bundle_id": "in.theporter.customerapp"
-        },
-        "has_ios": True,
-        "has_p90_launch_time": True
-    },
-    "vendor": {
-        "name": "Vendor App",
-        "firebase_project": "pnmvendorapp",
-        "android": {
-            "app_id": "android:in.porter.pnm.vendor.app",
-            "package_name": "in.porter.pnm.vendor.app",
-            "play_console": {
-                "developer_id": "4707055851875633325",
-                "app_id": "4975591217808574162"
-            }
-        },
-        "has_ios": False,
-        "has_p90_launch_time": True
-    },
-    "owner": {
-        "name": "Owner App",
-        "firebase_project": "owner-app-29e1d",
-        "android": {
-            "app_id": "android:com.porter.android.partnerownerapp",
-            "package_name": "com.porter.android.partnerownerapp",
-            "play_console": {
-                "developer_id": "4707055851875633325",
-                "app_id": "4974844181868761677"
-            }
-        },
-        "ios": {
-            "app_id": "ios:com.porter.partnerownerapp",
-            "bundle_id": "com.porter.partnerownerapp"
-        },
-        "has_ios": True,
-        "has_p90_launch_time": False
-    }
-}
+# (frozen, slotted dataclasses: fast attribute access and no accidental mutation)
+@dataclass(frozen=True, slots=True)
+class PlayConsoleConfig:
+    developer_id: str
+    app_id: str
+
+@dataclass(frozen=True, slots=True)
+class AndroidConfig:
+    app_id: str
+    package_name: str
+    play_console: PlayConsoleConfig
+
+@dataclass(frozen=True, slots=True)
+class IosConfig:
+    app_id: str
+    bundle_id: str
+
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    name: str
+    firebase_project: str
+    android: AndroidConfig
+    ios: IosConfig | None = None
+    has_ios: bool = False
+    has_p90_launch_time: bool = True
+
+APPS_CONFIG: Mapping[str, AppConfig] = MappingProxyType({
+    "partner": AppConfig(
+        name="Partner App",
+        firebase_project="driverapp-f56a2",
+        android=AndroidConfig(
+            app_id="android:com.theporter.android.driverapp",
+            package_name="com.theporter.android.driverapp",
+            play_console=PlayConsoleConfig(
+                developer_id="4707055851875633325",
+                app_id="4972278085731896191"
+            )
+        ),
+        has_ios=False,
+        has_p90_launch_time=True
+    ),
+    "customer": AppConfig(
+        name="Customer App",
+        firebase_project="portercustomerapp",
+        android=AndroidConfig(
+            app_id="android:com.theporter.android.customerapp",
+            package_name="com.theporter.android.customerapp",
+            play_console=PlayConsoleConfig(
+                developer_id="4707055851875633325",
+                app_id="4975635893417729870"
+            )
+        ),
+        ios=IosConfig(
+            app_id="ios:in.theporter.customerapp",
+            bundle_id="in.theporter.customerapp"
+        ),
+        has_ios=True,
+        has_p90_launch_time=True
+    ),
+    "vendor": AppConfig(
+        name="Vendor App",
+        firebase_project="pnmvendorapp",
+        android=AndroidConfig(
+            app_id="android:in.porter.pnm.vendor.app",
+            package_name="in.porter.pnm.vendor.app",
+            play_console=PlayConsoleConfig(
+                developer_id="4707055851875633325",
+                app_id="4975591217808574162"
+            )
+        ),
+        has_ios=False,
+        has_p90_launch_time=True
+    ),
+    "owner": AppConfig(
+        name="Owner App",
+        firebase_project="owner-app-29e1d",
+        android=AndroidConfig(
+            app_id="android:com.porter.android.partnerownerapp",
+            package_name="com.porter.android.partnerownerapp",
+            play_console=PlayConsoleConfig(
+                developer_id="4707055851875633325",
+                app_id="4974844181868761677"
+            )
+        ),
+        ios=IosConfig(
+            app_id="ios:com.porter.partnerownerapp",
+            bundle_id="com.porter.partnerownerapp"
+        ),
+        has_ios=True,
+        has_p90_launch_time=False
+    )
+})
 
 # Google Play Vitals configuration
 # Service account file path can be set via GOOGLE_PLAY_SERVICE_ACCOUNT environment variable
@@ -101,29 +150,104 @@ SCOPES = [
     'https://www.googleapis.com/auth/androidpublisher'
 ]
 
+# Play Developer Reporting metric set for each metric, keyed by name without the window suffix
+_METRIC_ENDPOINTS = {
+    'anrRate': 'anrRateMetricSet',
+    'userPerceivedAnrRate': 'anrRateMetricSet',
+    'crashRate': 'crashRateMetricSet',
+    'userPerceivedCrashRate': 'crashRateMetricSet',
+    'slowStartRate': 'slowStartRateMetricSet',
+    'userPerceivedLmkRate': 'lmkRateMetricSet',
+    'excessiveWakeupRate': 'excessiveWakeupRateMetricSet',
+    'stuckBgWakelockRate': 'stuckBackgroundWakelockRateMetricSet',
+}
+
+# Google Play Vitals output field for each tracked base metric name
+_VITALS_METRICS = {
+    "anr_rate": "anrRate",
+    "user_perceived_anr_rate": "userPerceivedAnrRate",
+    "crash_rate": "crashRate",
+    "user_perceived_crash_rate": "userPerceivedCrashRate",
+    "slow_start_rate": "slowStartRate",
+    "excessive_wakeup_rate": "excessiveWakeupRate",
+    "stuck_wakelock_rate": "stuckBgWakelockRate",
+    "user_perceived_lmk_rate": "userPerceivedLmkRate",
+}
+
+# Interned full metric names per window suffix, keyed by output field
+_VITALS_METRIC_KEYS = {
+    suffix: {field: sys.intern(base + suffix) for field, base in _VITALS_METRICS.items()}
+    for suffix in ("7dUserWeighted", "28dUserWeighted")
+}
+
+# Rate metrics come back as fractions and are stored as percentages
+_IS_RATE_METRIC = {
+    metric_name: 'Rate' in metric_name
+    for metric_keys in _VITALS_METRIC_KEYS.values()
+    for metric_name in metric_keys.values()
+}
+
+# Service account credentials, loaded on first use and reused until the token expires
+_PLAY_CREDENTIALS = None
+
 # Global date range configuration (defaults to 7 days)
 DATE_RANGE_DAYS = 7
 
+# How long to wait for each collection phase's data before moving on
+PHASE_TIMEOUT_SECONDS = 120
+
+# ANR issues arrive just after the ANR metrics, so this wait is kept short
+ANRS_TIMEOUT_SECONDS = 10
+
+# How long the first iOS page load gets to deliver metrics before a single reload
+IOS_FIRST_LOAD_TIMEOUT_SECONDS = 60
+
+# How many apps are collected at once, each in its own browser tab
+MAX_CONCURRENT_APPS = 4
+
+# GA4 Dominant Release URL skeletons, filled in by _build_urls with str.format
+# Note: The fpn parameter (324301932190) appears to be project number - may need to be configurable
+_IOS_DOMINANT_RELEASE_TMPL = (
+    "https://console.firebase.google.com/u/0/project/{project}/analytics/app/{app}/overview/"
+    "reports~2Fexplorer%3Fparams%3D_r.explorerCard..selmet%253D%255B%2522activeUsers%2522%255D%2526_r.explorerCard..seldim%253D%255B%2522appVersion%2522%255D"
+    "%2526_r..dataFilters%253D%255B%257B%2522type%2522%253A1%252C%2522fieldName%253A%2522operatingSystem%2522%252C%2522evaluationType%2522%253A4%252C%2522expressionList%253A%255B%2522iOS%2522%255D%252C%2522complement%2522%253Afalse%252C%2522isCaseSensitive%253Atrue%252C%2522expression%253A%2522%2522%257D%255D"
+    "%2526_u.dateOption%253D{date}%2526_u.comparisonOption%253Ddisabled&r%3Duser-technology-detail&fpn%3D324301932190"
+)
+_ANDROID_DOMINANT_RELEASE_TMPL = (
+    "https://console.firebase.google.com/u/0/project/{project}/analytics/app/{app}/overview/"
+    "reports~2Fexplorer%3Fparams%3D_r.explorerCard..selmet%253D%255B%2522activeUsers%2522%255D%2526_r.explorerCard..seldim%253D%255B%2522appVersion%2522%255D"
+    "%2526_r..dataFilters%253D%255B%257B%2522type%2522%253A1%252C%2522fieldName%253A%2522operatingSystem%2522%252C%2522evaluationType%253A3%252C%2522expressionList%253A%255B%2522iOS%2522%255D%252C%2522complement%253Atrue%252C%2522isCaseSensitive%253Atrue%252C%2522expression%253A%2522%2522%257D%255D"
+    "%2526_r.copa-filter-builder..filter-to-edit%253D%255B%257B%2522type%2522%253A1%252C%2522fieldName%253A%2522operatingSystem%2522%252C%2522evaluationType%253A4%252C%2522expressionList%253A%255B%2522iOS%2522%255D%252C%2522complement%253Afalse%252C%2522isCaseSensitive%253Atrue%252C%2522expression%253A%2522%2522%257D%255D%2526_u.comparisonOption%253Ddisabled%2526_u.dateOption%253D{date}"
+    "&r%3Duser-technology-detail&fpn%3D324301932190"
+)
+
+# Report windows accepted on the command line
+_VALID_DAYS: frozenset[str] = frozenset({"7", "30"})
+
 def _choose_report_days() -> int:
     # Prefer CLI arg: python script.py 7  OR  python script.py 30
     for arg in sys.argv[1:]:
-        if arg.strip() in {"7", "30"}:
-            return int(arg.strip())
-        if arg.lower().startswith("--days="):
-            val = arg.split("=", 1)[1].strip()
-            if val in {"7", "30"}:
+        arg = arg.strip()
+        if arg in _VALID_DAYS:
+            return int(arg)
+        if arg[:7].lower() == "--days=":
+            val = arg[7:].strip()
+            if val in _VALID_DAYS:
                 return int(val)
     # Default to 7 days (no prompt)
     return 7
 
-def _build_urls(report_days: int, app_key: str, app_config: dict):
+# Report window selected on the command line, resolved once at load
+REPORT_DAYS = _choose_report_days()
+
+def _build_urls(report_days: int, app_key: str, app_config: AppConfig):
     """
     Build URLs for a specific app based on configuration
     
     Args:
         report_days: Number of days for the report (7 or 30)
         app_key: Key of the app in APPS_CONFIG (e.g., "customer", "partner")
-        app_config: App configuration dictionary from APPS_CONFIG
+        app_config: App configuration from APPS_CONFIG
     """
     # Firebase time window
     firebase_time = "last-seven-days" if report_days == 7 else "last-thirty-days"
@@ -134,8 +258,15 @@ def _build_urls(report_days: int, app_key: str, app_config: dict):
     # Android Performance trends
     perf_time = "7d" if report_days == 7 else "30d"
 
-    firebase_project = app_config["firebase_project"]
-    android_app = app_config["android"]["app_id"]
+    # Read every config value once up front
+    firebase_project = app_config.firebase_project
+    android = app_config.android
+    android_app = android.app_id
+    play_console = android.play_console
+    developer_id = play_console.developer_id
+    play_console_app_id = play_console.app_id
+    has_p90_launch_time = app_config.has_p90_launch_time
+    ios = app_config.ios if app_config.has_ios else None
     
     # Firebase Crashlytics base
     base = f"https://console.firebase.google.com/u/0/project/{firebase_project}/crashlytics/app"
@@ -145,24 +276,8 @@ def _build_urls(report_days: int, app_key: str, app_config: dict):
     top_non_fatals_url = f"{base}/{android_app}/issues?state=open&time={firebase_time}&tag=all&sort=userCount&types=error"
     top_anrs_url = f"{base}/{android_app}/issues?state=open&time={firebase_time}&tag=all&sort=userCount&types=ANR"
 
-    # GA4 Dominant Release URLs (use encoded last7Days/last28Days)
-    ios_dom = (
-        "https://console.firebase.google.com/u/0/project/portercustomerapp/analytics/app/ios:in.theporter.customerapp/overview/"
-        "reports~2Fexplorer%3Fparams%3D_r.explorerCard..selmet%253D%255B%2522activeUsers%2522%255D%2526_r.explorerCard..seldim%253D%255B%2522appVersion%2522%255D"
-        "%2526_r..dataFilters%253D%255B%257B%2522type%2522%253A1%252C%2522fieldName%2522%253A%2522operatingSystem%2522%252C%2522evaluationType%2522%253A4%252C%2522expressionList%2522%253A%255B%2522iOS%2522%255D%252C%2522complement%2522%253Afalse%252C%2522isCaseSensitive%2522%253Atrue%252C%2522expression%2522%253A%2522%2522%257D%255D"
-        f"%2526_u.dateOption%253D{ga_date_option}%2526_u.comparisonOption%253Ddisabled&r%3Duser-technology-detail&fpn%3D324301932190"
-    )
-    android_dom = (
-        "https://console.firebase.google.com/u/0/project/portercustomerapp/analytics/app/ios:in.theporter.customerapp/overview/"
-        "reports~2Fexplorer%3Fparams%3D_r.explorerCard..selmet%253D%255B%2522activeUsers%2522%255D%2526_r.explorerCard..seldim%253D%255B%2522appVersion%2522%255D"
-        "%2526_r..dataFilters%253D%255B%257B%2522type%2522%253A1%252C%2522fieldName%2522%253A%2522operatingSystem%2522%252C%2522evaluationType%2522%253A3%252C%2522expressionList%2522%253A%255B%2522iOS%2522%255D%252C%2522complement%2522%253Atrue%252C%2522isCaseSensitive%2522%253Atrue%252C%2522expression%2522%253A%2522%2522%257D%255D"
-        f"%2526_r.copa-filter-builder..filter-to-edit%253D%255B%257B%2522type%2522%253A1%252C%2522fieldName%2522%253A%2522operatingSystem%2522%252C%2522evaluationType%2522%253A4%252C%2522expressionList%2522%253A%255B%2522iOS%2522%255D%252C%2522complement%2522%253Afalse%252C%2522isCaseSensitive%2522%253Atrue%252C%2522expression%2522%253A%2522%2522%257D%255D%2526_u.comparisonOption%253Ddisabled%2526_u.dateOption%253D{ga_date_option}"
-        "&r%3Duser-technology-detail&fpn%3D324301932190"
-    )
-
-    play_console = app_config["android"]["play_console"]
     play_console_anr_url = (
-        f"https://play.google.com/console/u/0/developers/{play_console['developer_id']}/app/{play_console['app_id']}/vitals/crashes"
+        f"https://play.google.com/console/u/0/developers/{developer_id}/app/{play_console_app_id}/vitals/crashes"
         f"?days={pc_days}&isUserPerceived=true&errorType=ANR"
     )
 
@@ -175,7 +290,7 @@ def _build_urls(report_days: int, app_key: str, app_config: dict):
     }
     
     # Add P90 launch URL only if app has P90 launch time trace
-    if app_config.get("has_p90_launch_time", True):
+    if has_p90_launch_time:
         android_p90_launch_url = (
             f"https://console.firebase.google.com/u/0/project/{firebase_project}/performance/app/"
             f"{android_app}/trends?time={perf_time}"
@@ -183,26 +298,14 @@ def _build_urls(report_days: int, app_key: str, app_config: dict):
         urls["android_p90_launch_url"] = android_p90_launch_url
     
     # iOS URLs (only if app has iOS)
-    if app_config.get("has_ios") and "ios" in app_config:
-        ios_app = app_config["ios"]["app_id"]
+    if ios is not None:
+        ios_app = ios.app_id
         ios_crashes_url = f"{base}/{ios_app}/issues?state=open&time={firebase_time}&types=crash&tag=all&sort=userCount"
         ios_non_fatals_url = f"{base}/{ios_app}/issues?state=open&time={firebase_time}&types=error&tag=all&sort=eventCount"
         
         # GA4 Dominant Release URLs (use encoded last7Days/last28Days)
-        # Note: The fpn parameter (324301932190) appears to be project number - may need to be configurable
-        ios_dom = (
-            f"https://console.firebase.google.com/u/0/project/{firebase_project}/analytics/app/{ios_app}/overview/"
-            "reports~2Fexplorer%3Fparams%3D_r.explorerCard..selmet%253D%255B%2522activeUsers%2522%255D%2526_r.explorerCard..seldim%253D%255B%2522appVersion%2522%255D"
-            "%2526_r..dataFilters%253D%255B%257B%2522type%2522%253A1%252C%2522fieldName%253A%2522operatingSystem%2522%252C%2522evaluationType%2522%253A4%252C%2522expressionList%253A%255B%2522iOS%2522%255D%252C%2522complement%2522%253Afalse%252C%2522isCaseSensitive%253Atrue%252C%2522expression%253A%2522%2522%257D%255D"
-            f"%2526_u.dateOption%253D{ga_date_option}%2526_u.comparisonOption%253Ddisabled&r%3Duser-technology-detail&fpn%3D324301932190"
-        )
-        android_dom = (
-            f"https://console.firebase.google.com/u/0/project/{firebase_project}/analytics/app/{ios_app}/overview/"
-            "reports~2Fexplorer%3Fparams%3D_r.explorerCard..selmet%253D%255B%2522activeUsers%2522%255D%2526_r.explorerCard..seldim%253D%255B%2522appVersion%2522%255D"
-            "%2526_r..dataFilters%253D%255B%257B%2522type%2522%253A1%252C%2522fieldName%253A%2522operatingSystem%2522%252C%2522evaluationType%253A3%252C%2522expressionList%253A%255B%2522iOS%2522%255D%252C%2522complement%253Atrue%252C%2522isCaseSensitive%253Atrue%252C%2522expression%253A%2522%2522%257D%255D"
-            f"%2526_r.copa-filter-builder..filter-to-edit%253D%255B%257B%2522type%2522%253A1%252C%2522fieldName%253A%2522operatingSystem%2522%252C%2522evaluationType%253A4%252C%2522expressionList%253A%255B%2522iOS%2522%255D%252C%2522complement%253Afalse%252C%2522isCaseSensitive%253Atrue%252C%2522expression%253A%2522%2522%257D%255D%2526_u.comparisonOption%253Ddisabled%2526_u.dateOption%253D{ga_date_option}"
-            "&r%3Duser-technology-detail&fpn%3D324301932190"
-        )
+        ios_dom = _IOS_DOMINANT_RELEASE_TMPL.format(project=firebase_project, app=ios_app, date=ga_date_option)
+        android_dom = _ANDROID_DOMINANT_RELEASE_TMPL.format(project=firebase_project, app=ios_app, date=ga_date_option)
         
         urls["ios_crashes_url"] = ios_crashes_url
         urls["ios_non_fatals_url"] = ios_non_fatals_url
@@ -211,68 +314,57 @@ def _build_urls(report_days: int, app_key: str, app_config: dict):
     else:
         # Android dominant release URL for apps without iOS
         # Use Android app ID for analytics
-        android_dom = (
-            f"https://console.firebase.google.com/u/0/project/{firebase_project}/analytics/app/{android_app}/overview/"
-            "reports~2Fexplorer%3Fparams%3D_r.explorerCard..selmet%253D%255B%2522activeUsers%2522%255D%2526_r.explorerCard..seldim%253D%255B%2522appVersion%2522%255D"
-            "%2526_r..dataFilters%253D%255B%257B%2522type%2522%253A1%252C%2522fieldName%253A%2522operatingSystem%2522%252C%2522evaluationType%253A3%252C%2522expressionList%253A%255B%2522iOS%2522%255D%252C%2522complement%253Atrue%252C%2522isCaseSensitive%253Atrue%252C%2522expression%253A%2522%2522%257D%255D"
-            f"%2526_r.copa-filter-builder..filter-to-edit%253D%255B%257B%2522type%2522%253A1%252C%2522fieldName%253A%2522operatingSystem%2522%252C%2522evaluationType%253A4%252C%2522expressionList%253A%255B%2522iOS%2522%255D%252C%2522complement%253Afalse%252C%2522isCaseSensitive%253Atrue%252C%2522expression%253A%2522%2522%257D%255D%2526_u.comparisonOption%253Ddisabled%2526_u.dateOption%253D{ga_date_option}"
-            "&r%3Duser-technology-detail&fpn%3D324301932190"
-        )
+        android_dom = _ANDROID_DOMINANT_RELEASE_TMPL.format(project=firebase_project, app=android_app, date=ga_date_option)
         urls["android_dominant_release_url"] = android_dom
     
     return urls
 
-def get_google_play_vitals(report_days: int, package_name: str):
+def _compile_builder(app_key: str, app_config: AppConfig):
+    """
+    Specialize URL building for one app: both report windows are rendered up front,
+    leaving report_days as the only runtime input. Callers must not mutate the result.
+    """
+    urls_7d = _build_urls(7, app_key, app_config)
+    urls_30d = _build_urls(30, app_key, app_config)
+
+    def build(report_days: int):
+        return urls_7d if report_days == 7 else urls_30d
+
+    return build
+
+# Per-app URL builders, compiled once at import
+_URL_BUILDERS = {app_key: _compile_builder(app_key, cfg) for app_key, cfg in APPS_CONFIG.items()}
+
+def _get_play_access_token() -> str:
+    """Return a valid Google Play access token, refreshing the cached credentials only when needed"""
+    global _PLAY_CREDENTIALS
+    if _PLAY_CREDENTIALS is None:
+        _PLAY_CREDENTIALS = service_account.Credentials.from_service_account_file(
+            SERVICE_ACCOUNT_FILE, scopes=SCOPES)
+    if not _PLAY_CREDENTIALS.valid:
+        _PLAY_CREDENTIALS.refresh(Request())
+    return _PLAY_CREDENTIALS.token
+
+async def get_google_play_vitals(session, access_token: str, report_days: int, package_name: str):
     """Fetch current Google Play Vitals data for a specific package"""
-    if not GOOGLE_PLAY_AVAILABLE:
-        return None
-        
     try:
-        # Check if service account file exists
-        if not os.path.exists(SERVICE_ACCOUNT_FILE):
-            print(f"⚠️  Google Play service account file not found: {SERVICE_ACCOUNT_FILE}")
-            print(f"   Set GOOGLE_PLAY_SERVICE_ACCOUNT environment variable to specify the path")
-            return None
-        
-        def get_access_token():
-            credentials = service_account.Credentials.from_service_account_file(
-                SERVICE_ACCOUNT_FILE, scopes=SCOPES)
-            auth_req = Request()
-            credentials.refresh(auth_req)
-            return credentials.token
-
-        def fetch_metrics_for_date(target_date, metrics_list):
-            """Fetch specified metrics for a specific date"""
-            def metric_to_endpoint(metric_name: str) -> str:
-                if metric_name.startswith('anrRate') or metric_name.startswith('userPerceivedAnrRate'):
-                    return 'anrRateMetricSet'
-                if metric_name.startswith('crashRate') or metric_name.startswith('userPerceivedCrashRate'):
-                    return 'crashRateMetricSet'
-                if metric_name.startswith('slowStartRate'):
-                    return 'slowStartRateMetricSet'
-                if metric_name.startswith('userPerceivedLmkRate'):
-                    return 'lmkRateMetricSet'
-                if metric_name.startswith('excessiveWakeupRate'):
-                    return 'excessiveWakeupRateMetricSet'
-                if metric_name.startswith('stuckBgWakelockRate'):
-                    return 'stuckBackgroundWakelockRateMetricSet'
-                return ''
-
+        async def fetch_metrics_for_range(start_date, end_date, metrics_list):
+            """Fetch specified metrics for every day from start_date to end_date (inclusive)"""
             endpoint_metrics = defaultdict(list)
             for metric in metrics_list:
-                endpoint = metric_to_endpoint(metric)
+                endpoint = _METRIC_ENDPOINTS.get(metric.removesuffix(suffix))
                 if endpoint:
                     endpoint_metrics[endpoint].append(metric)
 
             all_results = {}
-            access_token = get_access_token()
             headers = {
                 "Content-Type": "application/json",
                 "Authorization": f"Bearer {access_token}"
             }
 
-            end_date = target_date + timedelta(days=1)
+            end_time = end_date + timedelta(days=1)
 
+            requests_to_send = []
             for endpoint, endpoint_metric_list in endpoint_metrics.items():
                 url = f"https://playdeveloperreporting.googleapis.com/v1beta1/apps/{package_name}/{endpoint}:query"
 
@@ -281,14 +373,14 @@ def get_google_play_vitals(report_days: int, package_name: str):
                     "timelineSpec": {
                         "aggregationPeriod": "DAILY",
                         "startTime": {
-                            "year": target_date.year,
-                            "month": target_date.month,
-                            "day": target_date.day
+                            "year": start_date.year,
+                            "month": start_date.month,
+                            "day": start_date.day
                         },
                         "endTime": {
-                            "year": end_date.year,
-                            "month": end_date.month,
-                            "day": end_date.day
+                            "year": end_time.year,
+                            "month": end_time.month,
+                            "day": end_time.day
                         }
                     }
                 }
@@ -296,27 +388,54 @@ def get_google_play_vitals(report_days: int, package_name: str):
                 if endpoint == 'slowStartRateMetricSet':
                     body["dimensions"] = ["startType"]
 
-                try:
-                    response = requests.post(url, headers=headers, json=body)
-                    if response.status_code == 200:
-                        all_results[endpoint] = response.json()
-                    time.sleep(0.1)
-                except:
-                    continue
-
-            # Combine results
-            combined_result = {"rows": []}
-            all_metrics = []
+                requests_to_send.append((endpoint, url, body))
+
+            async def query(endpoint, url, body):
+                # A window ending past the metric set's freshest data is rejected (400), so step
+                # the end back a day at a time, like the old per-day probe did
+                query_end = end_time
+                while True:
+                    async with session.post(url, headers=headers, json=body) as response:
+                        if response.status == 200:
+                            all_results[endpoint] = _json_loads(await response.read())
+                            return
+                        error_text = await response.text()
+                    print(f"⚠️  {package_name} {endpoint} returned HTTP {response.status} "
+                          f"for days before {query_end}: {error_text[:500]}")
+                    query_end -= timedelta(days=1)
+                    if response.status != 400 or query_end <= start_date:
+                        return
+                    body = {**body, "timelineSpec": {**body["timelineSpec"], "endTime": {
+                        "year": query_end.year,
+                        "month": query_end.month,
+                        "day": query_end.day
+                    }}}
+
+            # Endpoints are independent, so issue the queries concurrently;
+            # a failed endpoint just leaves its metrics out
+            results = await asyncio.gather(
+                *(query(endpoint, url, body) for endpoint, url, body in requests_to_send),
+                return_exceptions=True
+            )
+            for (endpoint, _, _), result in zip(requests_to_send, results):
+                if isinstance(result, Exception):
+                    print(f"⚠️  {package_name} {endpoint} query failed: {result!r}")
+
+            # Combine results into one row per day, oldest first
+            metrics_by_date = defaultdict(list)
 
             for endpoint, data in all_results.items():
-                if data.get('rows'):
-                    for row in data['rows']:
-                        all_metrics.extend(row.get('metrics', []))
-
-            if all_metrics:
-                combined_result["rows"] = [{"metrics": all_metrics}]
-
-            return combined_result
+                for row in data.get('rows', []):
+                    start_time = row.get('startTime', {})
+                    row_date = date(start_time['year'], start_time['month'], start_time['day'])
+                    metrics_by_date[row_date].extend(row.get('metrics', []))
+
+            return {
+                "rows": [
+                    {"date": row_date, "metrics": metrics_by_date[row_date]}
+                    for row_date in sorted(metrics_by_date)
+                ]
+            }
 
         def parse_metrics_from_response(data):
             """Extract metrics from API response"""
@@ -326,11 +445,14 @@ def get_google_play_vitals(report_days: int, package_name: str):
             metrics = {}
             for row in data.get('rows', []):
                 for metric in row.get('metrics', []):
-                    metric_name = metric['metric']
+                    metric_name = sys.intern(metric['metric'])
 
                     if 'decimalValue' in metric:
                         metric_value = float(metric['decimalValue']['value'])
-                        if 'Rate' in metric_name:
+                        is_rate = _IS_RATE_METRIC.get(metric_name)
+                        if is_rate is None:
+                            is_rate = 'Rate' in metric_name
+                        if is_rate:
                             metric_value *= 100
                         metrics[metric_name] = round(metric_value, 3)
                     elif 'intValue' in metric:
@@ -346,35 +468,29 @@ def get_google_play_vitals(report_days: int, package_name: str):
             suffix = "28dUserWeighted"  # GA metrics commonly expose 28d variant
             lookback = 31
 
-        metrics_list = [
-            f'anrRate{suffix}',
-            f'userPerceivedAnrRate{suffix}',
-            f'crashRate{suffix}',
-            f'userPerceivedCrashRate{suffix}',
-            f'slowStartRate{suffix}',
-            f'excessiveWakeupRate{suffix}',
-            f'stuckBgWakelockRate{suffix}',
-            f'userPerceivedLmkRate{suffix}'
-        ]
+        metric_keys = _VITALS_METRIC_KEYS[suffix]
+        metrics_list = list(metric_keys.values())
 
         # Find latest available date with data (look back up to selection window)
+        # with a single query over the whole window instead of probing day by day
         base_date = datetime.now().date()
         latest_date = None
         current_data = None
-        
-        for days_back in range(1, lookback):
-            test_date = base_date - timedelta(days=days_back)
-            try:
-                # Test with a simple metric first
-                data = fetch_metrics_for_date(test_date, [f"anrRate{suffix}"])
-                if data.get('rows'):
-                    latest_date = test_date
-                    # Fetch all metrics for this date
-                    current_data = fetch_metrics_for_date(latest_date, metrics_list)
-                    break
-            except:
-                continue
-        
+
+        range_data = await fetch_metrics_for_range(
+            base_date - timedelta(days=lookback - 1),
+            base_date - timedelta(days=1),
+            metrics_list
+        )
+        # Like the old per-day probe, the latest date is the newest one with ANR data
+        # (other metric sets can be a day ahead of it)
+        anr_metric = metric_keys["anr_rate"]
+        for row in reversed(range_data["rows"]):
+            if any(metric.get('metric') == anr_metric for metric in row["metrics"]):
+                latest_date = row["date"]
+                current_data = {"rows": [row]}
+                break
+
         if not latest_date or not current_data:
             raise Exception(f"No data available in the last {report_days} days")
         
@@ -382,17 +498,9 @@ def get_google_play_vitals(report_days: int, package_name: str):
         current_metrics = parse_metrics_from_response(current_data)
 
         # Format for JSON output
-        vitals_data = {
-            "date": latest_date.isoformat(),
-            "anr_rate": current_metrics.get(f'anrRate{suffix}'),
-            "user_perceived_anr_rate": current_metrics.get(f'userPerceivedAnrRate{suffix}'),
-            "crash_rate": current_metrics.get(f'crashRate{suffix}'),
-            "user_perceived_crash_rate": current_metrics.get(f'userPerceivedCrashRate{suffix}'),
-            "slow_start_rate": current_metrics.get(f'slowStartRate{suffix}'),
-            "excessive_wakeup_rate": current_metrics.get(f'excessiveWakeupRate{suffix}'),
-            "stuck_wakelock_rate": current_metrics.get(f'stuckBgWakelockRate{suffix}'),
-            "user_perceived_lmk_rate": current_metrics.get(f'userPerceivedLmkRate{suffix}')
-        }
+        vitals_data = {"date": latest_date.isoformat()}
+        for field, metric_name in metric_keys.items():
+            vitals_data[field] = current_metrics.get(metric_name)
 
         return vitals_data
 
@@ -400,16 +508,263 @@ def get_google_play_vitals(report_days: int, package_name: str):
         print(f"⚠️  Failed to fetch Google Play Vitals data: {e}")
         return None
 
-async def collect_app_data(report_days: int, app_key: str, app_config: dict, page):
+# URL fragments identifying the API responses we parse (plain substrings, no regex needed)
+_PAT_METRICS = "metrics:getMetricsReport"
+_PAT_TOP_ISSUES = "metrics:listFirebaseTopOpenIssues"
+_PAT_PLAY_CONSOLE_HOST = "playconsolehealth-pa.clients6.google.com"
+_PAT_PLAY_CONSOLE_ERROR_CLUSTERS = "errorClusters"
+_PAT_VENUS = "analytics.google.com/analytics/app/data/v2/venus?"
+_PAT_VENUS_REPORT = "reportId"
+_PAT_P90_TIMELINES = "traces/_as:listTimelines"
+_PAT_P90_VERSION_FILTER = "filter.appVersionValues"
+
+def _classify_url(url: str) -> str | None:
+    """Return the kind of payload a response URL carries, or None if it is never parsed"""
+    if _PAT_METRICS in url:
+        return "metrics"
+    if _PAT_TOP_ISSUES in url:
+        return "top_issues"
+    if _PAT_PLAY_CONSOLE_HOST in url and _PAT_PLAY_CONSOLE_ERROR_CLUSTERS in url:
+        return "play_console_anrs"
+    if _PAT_VENUS in url and _PAT_VENUS_REPORT in url:
+        return "dominant_release"
+    if _PAT_P90_TIMELINES in url and _PAT_P90_VERSION_FILTER not in url:
+        return "p90_launch"
+    return None
+
+async def fetch_all_google_play_vitals(report_days: int):
+    """Fetch Google Play Vitals for every app in APPS_CONFIG concurrently, keyed by app"""
+    if not GOOGLE_PLAY_AVAILABLE:
+        return {}
+
+    # Check if service account file exists
+    if not os.path.exists(SERVICE_ACCOUNT_FILE):
+        print(f"⚠️  Google Play service account file not found: {SERVICE_ACCOUNT_FILE}")
+        print(f"   Set GOOGLE_PLAY_SERVICE_ACCOUNT environment variable to specify the path")
+        return {}
+
+    try:
+        # Token refresh is blocking I/O, so keep it off the event loop
+        access_token = await asyncio.to_thread(_get_play_access_token)
+    except Exception as e:
+        print(f"⚠️  Failed to fetch Google Play Vitals data: {e}")
+        return {}
+
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+        results = await asyncio.gather(*(
+            get_google_play_vitals(session, access_token, report_days, app_config.android.package_name)
+            for app_config in APPS_CONFIG.values()
+        ))
+    return dict(zip(APPS_CONFIG, results))
+
+@lru_cache(maxsize=256)
+def _is_valid_date_range(start_time_str: str, end_time_str: str,
+                         expected_start_date: date, expected_end_date: date) -> bool:
+    """Whether a metrics interval spans exactly the expected dates (memoized; intervals repeat a lot)"""
+    try:
+        # Only the YYYY-MM-DD prefix matters for the comparison
+        start_date = date.fromisoformat(start_time_str[:10])
+        end_date = date.fromisoformat(end_time_str[:10])
+
+        # Check if end date is today and start date is DATE_RANGE_DAYS ago
+        return end_date == expected_end_date and start_date == expected_start_date
+    except:
+        return False
+
+def _iter_top_issues(json_response):
+    """Flatten a listFirebaseTopOpenIssues payload to (title, subtitle, impacted_devices, events) rows"""
+    for issue in json_response.get("topIssues", ()):
+        caption = issue.get("caption") or _EMPTY_CAPTION
+        yield (caption.get("title", "Unknown"),
+               caption.get("subtitle", "Unknown"),
+               _to_int(issue.get("impactedDevicesCount")),
+               _to_int(issue.get("eventsCount")))
+
+def _to_int(value) -> int:
+    """Int from a JSON count that may arrive as a number, a numeric string or be missing"""
+    if isinstance(value, int):
+        return value
+    return int(value) if value else 0
+
+# Where each issues phase stores its top issues in app_data: (platform, category)
+_TOP_ISSUE_TARGETS = {
+    "crashes": ("android", "top_crashes"),
+    "non_fatals": ("android", "top_non_fatals"),
+    "anrs": ("android", "all_anrs"),
+    "ios_crashes": ("ios", "top_crashes"),
+    "ios_non_fatals": ("ios", "top_non_fatals"),
+}
+
+# Phases whose page also loads the next phase's top issues (no new navigation): phase -> next phase
+_EARLY_TOP_ISSUES_PHASE = {
+    "anr_metrics": "anrs",
+    "ios_metrics": "ios_crashes",
+}
+
+# Shared read-only stand-ins for missing nested objects in API payloads
+_EMPTY_RATIO = MappingProxyType({"ratio": 0})
+_EMPTY_CAPTION = MappingProxyType({})
+
+async def _watchdog(event: asyncio.Event, label: str, step: float = 10, prefix: str = ""):
+    """Print a heartbeat every `step` seconds until `event` fires (cancelled by the waiter)"""
+    waited = 0
+    while True:
+        try:
+            await asyncio.wait_for(event.wait(), timeout=step)
+            return
+        except asyncio.TimeoutError:
+            waited += step
+            print(f"   {prefix}Still waiting for {label}... ({waited:g}s)")
+
+async def _read_json(response):
+    """Decode a response body as JSON straight from bytes, skipping any XSSI guard"""
+    body = await response.body()
+    # Strip the dangling `)]}',` prefix some Google APIs add
+    if body.startswith(b")]}',"):
+        body = body[5:]
+    return _json_loads(body)
+
+# Chromium switches for the collection browser: no background services, no images
+# (Blink never requests images, so they need no route handling)
+_CHROMIUM_ARGS = [
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--no-first-run",
+    "--blink-settings=imagesEnabled=false",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+]
+
+# Requests never worth loading: fonts/CSS and third-party telemetry beacons
+_BLOCK_RE = re.compile(
+    r"\.(?:css|woff2?|ttf)(?:\?|$)"
+    r"|google-analytics\.com|googletagmanager\.com|doubleclick\.net",
+    re.IGNORECASE,
+)
+
+async def _route_request(route):
+    """Abort heavy or useless requests, let everything else through"""
+    if _BLOCK_RE.search(route.request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+class _CdpResponse:
+    """The slice of a Playwright Response the handlers use, backed by a CDP request id"""
+    __slots__ = ("url", "post_data", "loader_id", "_client", "_request_id")
+
+    def __init__(self, client, request_id: str, url: str, post_data: str | None, loader_id: str | None = None):
+        self.url = url
+        self.post_data = post_data
+        self.loader_id = loader_id  # Document (navigation) that issued the request
+        self._client = client
+        self._request_id = request_id
+
+    async def body(self) -> bytes:
+        result = await self._client.send("Network.getResponseBody", {"requestId": self._request_id})
+        body = result["body"]
+        return base64.b64decode(body) if result.get("base64Encoded") else body.encode()
+
+async def _listen_for_responses(page, on_response):
+    """
+    Call on_response for every finished response we know how to parse, straight from CDP
+    Network events; everything else is dropped without crossing into Playwright's Response objects.
+    on_response is called the moment the response finishes loading and returns the coroutine that
+    processes it (or None to skip it), which then runs in the background
+    """
+    client = await page.context.new_cdp_session(page)
+    await client.send("Network.enable")
+
+    post_data = {}  # requestId -> request body, for interesting requests
+    loader_ids = {}  # requestId -> loaderId of the document that sent it, for interesting requests
+    fetch_post_data = set()  # requestIds whose body has to be asked for with getRequestPostData
+    pending = {}    # requestId -> URL, once headers arrived and until the body finishes loading
+    tasks = set()
+
+    def on_request(params):
+        request = params["request"]
+        if _classify_url(request["url"]) is None:
+            return
+        request_id = params["requestId"]
+        body = request.get("postData")
+        if body is None and request.get("hasPostData"):
+            # postData is deprecated and left out for large bodies: use postDataEntries
+            # when they carry the bytes, otherwise fetch the body once the response is in
+            entries = request.get("postDataEntries")
+            if entries and all("bytes" in entry for entry in entries):
+                body = b"".join(base64.b64decode(entry["bytes"]) for entry in entries).decode("utf-8", "replace")
+            else:
+                fetch_post_data.add(request_id)
+        post_data[request_id] = body
+        loader_ids[request_id] = params.get("loaderId")
+
+    async def deliver(request_id, response, work):
+        if request_id in fetch_post_data:
+            fetch_post_data.discard(request_id)
+            try:
+                result = await client.send("Network.getRequestPostData", {"requestId": request_id})
+                response.post_data = result.get("postData")
+            except Exception as e:
+                logger.debug("Could not fetch request body for %s: %s", response.url, e)
+        await work
+
+    def on_response_received(params):
+        url = params["response"]["url"]
+        if _classify_url(url) is not None:
+            pending[params["requestId"]] = url
+
+    def on_loading_finished(params):
+        request_id = params["requestId"]
+        url = pending.pop(request_id, None)
+        if url is None:
+            return
+        response = _CdpResponse(client, request_id, url, post_data.pop(request_id, None),
+                                loader_ids.pop(request_id, None))
+        work = on_response(response)
+        if work is None:
+            fetch_post_data.discard(request_id)
+            return
+        task = asyncio.create_task(deliver(request_id, response, work))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    def on_loading_failed(params):
+        pending.pop(params["requestId"], None)
+        post_data.pop(params["requestId"], None)
+        loader_ids.pop(params["requestId"], None)
+        fetch_post_data.discard(params["requestId"])
+
+    client.on("Network.requestWillBeSent", on_request)
+    client.on("Network.responseReceived", on_response_received)
+    client.on("Network.loadingFinished", on_loading_finished)
+    client.on("Network.loadingFailed", on_loading_failed)
+    return client
+
+class _AppLogAdapter(logging.LoggerAdapter):
+    """Prefix messages with the app they belong to; apps are collected concurrently"""
+
+    def process(self, msg, kwargs):
+        return f"[{self.extra['app']}] {msg}", kwargs
+
+async def _configure_page(page):
+    """Apply the default timeout and heavy-resource blocking to a page"""
+    page.set_default_timeout(60000)  # 60 second timeout
+    await page.route("**/*", _route_request)
+
+async def collect_app_data(report_days: int, app_key: str, app_config: AppConfig, page):
     """
     Collect vitals data for a specific app using the provided page
     Returns the collected app data dictionary
     """
     print(f"\n{'='*60}")
-    print(f"📱 Collecting data for {app_config['name']} ({app_key})")
+    print(f"📱 Collecting data for {app_config.name} ({app_key})")
     print(f"{'='*60}")
     
-    urls = _build_urls(report_days, app_key, app_config)
+    # Apps run side by side, so every per-app line names its app
+    tag = f"[{app_config.name}]"
+    log = _AppLogAdapter(logger, {"app": app_config.name})
+
+    urls = _URL_BUILDERS[app_key](report_days)
     firebase_url = urls["firebase_url"]
     top_crashes_url = urls["top_crashes_url"]
     top_non_fatals_url = urls["top_non_fatals_url"]
@@ -420,34 +775,38 @@ async def collect_app_data(report_days: int, app_key: str, app_config: dict, pag
     ios_dominant_release_url = urls.get("ios_dominant_release_url")
     android_dominant_release_url = urls.get("android_dominant_release_url")
     android_p90_launch_url = urls.get("android_p90_launch_url")
+
+    play_console_app_id = app_config.android.play_console.app_id
+
+    # Expected metrics window, fixed for the duration of this run
+    expected_end_date = datetime.now().date()
+    expected_start_date = expected_end_date - timedelta(days=DATE_RANGE_DAYS-1)
     
     try:
         # Set up request monitoring
         metrics_requests = []
-        metrics_captured = False
         fatal_installs = 0
         non_fatal_installs = 0
         anr_installs = 0
         ios_fatal_installs = 0
         ios_non_fatal_installs = 0
-        crashes_captured = False
-        non_fatals_captured = False
-        anr_metrics_captured = False
-        ios_metrics_captured = False
-        ios_crashes_captured = False
-        ios_non_fatals_captured = False
-        ios_crash_free_rate_captured = False
-        play_console_anrs_captured = False
-        ios_dominant_release_captured = False
-        android_dominant_release_captured = False
-        android_p90_launch_captured = False
         ios_nonfatal_issues_processed = False
+        # Top issues payloads that finished loading before their phase started, keyed by that phase
+        early_top_issues = {}
+        # Document the current phase navigated away from (None when the phase kept the page)
+        left_loader_id = None
+        # Set by handle_response the moment each payload has been parsed
+        events = {name: asyncio.Event() for name in (
+            "metrics", "crashes", "non_fatals", "anr_metrics", "anrs",
+            "ios_metrics", "ios_crashes", "ios_non_fatals", "play_console_anrs",
+            "ios_dominant_release", "android_dominant_release", "android_p90_launch"
+        )}
         current_phase = "metrics"  # "metrics", "crashes", "non_fatals", "anrs", "anr_metrics", "ios_metrics", "ios_crashes", "ios_non_fatals", "play_console_anrs", "ios_dominant_release", "android_dominant_release", "android_p90_launch"
         
         # Initialize JSON data structure for this app
         app_data = {
         "app_key": app_key,
-        "app_name": app_config["name"],
+        "app_name": app_config.name,
         "android": {
             "crash_free_rates": {},
             "total_installs": {},
@@ -473,605 +832,525 @@ async def collect_app_data(report_days: int, app_key: str, app_config: dict, pag
         
         def is_valid_date_range(start_time_str, end_time_str):
             """Check if the date range matches our expected range"""
+            return _is_valid_date_range(start_time_str, end_time_str,
+                                        expected_start_date, expected_end_date)
+        
+        async def _h_p90_launch(response, url, phase):
+            """Android P90 launch time from the traces timeline"""
             try:
-                start_time = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-                end_time = datetime.fromisoformat(end_time_str.replace('Z', '+00:00'))
-                
-                # Get today's date in UTC
-                today = datetime.now().replace(hour=23, minute=59, second=59, microsecond=0)
-                expected_start = today - timedelta(days=DATE_RANGE_DAYS-1)
-                expected_start = expected_start.replace(hour=0, minute=0, second=0, microsecond=0)
+                json_response = await _read_json(response)
+                timelines = json_response.get("timelines", [])
                 
-                # Check if end date is today and start date is DATE_RANGE_DAYS ago
-                return (end_time.date() == today.date() and 
-                        start_time.date() == expected_start.date())
-            except:
-                return False
-        
-        async def handle_response(response):
-            url = response.url
-            nonlocal metrics_captured
-            nonlocal fatal_installs, non_fatal_installs
-            nonlocal anr_installs, crashes_captured, non_fatals_captured
-            nonlocal anr_metrics_captured, current_phase
-            nonlocal ios_fatal_installs, ios_non_fatal_installs
-            nonlocal ios_metrics_captured, ios_crashes_captured, ios_non_fatals_captured
-            nonlocal ios_crash_free_rate_captured
-            nonlocal play_console_anrs_captured
-            nonlocal ios_dominant_release_captured, android_dominant_release_captured
-            nonlocal ios_nonfatal_issues_processed
-            nonlocal android_p90_launch_captured
-            nonlocal app_data
-
-            # Handle Android P90 Launch Time response
-            if (current_phase == "android_p90_launch" and 
-                "traces/_as:listTimelines" in url and
-                "filter.appVersionValues" not in url):
-                try:
-                    json_response = await response.json()
-                    timelines = json_response.get("timelines", [])
+                if timelines and len(timelines) > 0:
+                    projections = timelines[0].get("projections", [])
                     
-                    if timelines and len(timelines) > 0:
-                        projections = timelines[0].get("projections", [])
-                        
-                        # Get today's date for comparison
-                        today = datetime.now().date()
-                        yesterday = today - timedelta(days=1)
-                        
-                        # Find projection for today or yesterday
-                        target_projection = None
-                        for projection in projections:
-                            start_time_str = projection.get("startTime", "")
-                            if start_time_str:
-                                try:
-                                    start_time = datetime.fromisoformat(start_time_str.replace('Z', '+00:00')).date()
-                                    if start_time == today or start_time == yesterday:
-                                        target_projection = projection
-                                        break
-                                except:
-                                    continue
-                        
-                        if target_projection:
-                            quantiles = target_projection.get("projection", {}).get("quantiles", [])
-                            if len(quantiles) >= 19:
-                                # P90 is at index 18, convert from microseconds to seconds
-                                p90_microseconds = float(quantiles[18])  # Convert to float first
-                                p90_seconds = round(p90_microseconds / 1000000, 2)
-                                
-                                print(f"⚡ Android P90 Launch Time: {p90_seconds}s")
-                                app_data["android"]["p90_launch_time_seconds"] = p90_seconds
-                                android_p90_launch_captured = True
-                except Exception as e:
-                    print(f"❌ Error parsing Android P90 launch time response: {e}")
+                    # Get today's date for comparison (as YYYY-MM-DD prefixes)
+                    today = datetime.now().date()
+                    target_prefixes = (today.isoformat(), (today - timedelta(days=1)).isoformat())
+                    
+                    # Find projection for today or yesterday
+                    target_projection = None
+                    for projection in projections:
+                        if projection.get("startTime", "")[:10] in target_prefixes:
+                            target_projection = projection
+                            break
+                    
+                    if target_projection:
+                        quantiles = target_projection.get("projection", {}).get("quantiles", [])
+                        if len(quantiles) >= 19:
+                            # P90 is at index 18, convert from microseconds to seconds
+                            p90_microseconds = float(quantiles[18])  # Convert to float first
+                            p90_seconds = round(p90_microseconds / 1000000, 2)
+                            
+                            log.debug("⚡ Android P90 Launch Time: %ss", p90_seconds)
+                            app_data["android"]["p90_launch_time_seconds"] = p90_seconds
+                            events["android_p90_launch"].set()
+            except Exception as e:
+                log.error("❌ Error parsing Android P90 launch time response: %s", e)
+
+        async def _h_dominant_release(response, url, phase):
+            """Dominant release version from the Analytics Venus report"""
+            try:
+                json_response = await _read_json(response)
 
-            # Handle Dominant Release response
-            if (current_phase in ["ios_dominant_release", "android_dominant_release"] and 
-                "analytics.google.com/analytics/app/data/v2/venus?" in url and "reportId" in url):
+                # Extract dominant release data
+                # (the third response's first row; anything missing means no data yet)
                 try:
-                    response_text = await response.text()
-
-                    # Strip the dangling `)]}',` prefix
-                    if response_text.startswith(")]}',"):
-                        response_text = response_text[5:]
-
-                    json_response = json.loads(response_text)
-
-                    # Extract dominant release data
-                    dominant_releases = json_response.get("default", {}).get("responses", [])
-                    if len(dominant_releases) >= 3 and dominant_releases[2].get("responseRows"):
-                        release_data = dominant_releases[2]["responseRows"][0].get("dimensionCompoundValues", [])
-                        if release_data:
-                            # Extract version - handle both string and dict formats
-                            version_data = release_data[0]
-                            if isinstance(version_data, dict) and 'value' in version_data:
-                                dominant_version = version_data['value']
-                            else:
-                                dominant_version = str(version_data)
-                            platform = "iOS" if current_phase == "ios_dominant_release" else "Android"
-                            print(f"📱 {platform} Dominant Release: {dominant_version}")
-
-                            if current_phase == "ios_dominant_release":
-                                ios_dominant_release_captured = True
-                                app_data["ios"]["dominant_release"] = dominant_version
-                            else:  # android_dominant_release
-                                android_dominant_release_captured = True
-                                app_data["android"]["dominant_release"] = dominant_version
-                except Exception as e:
-                    print(f"❌ Error parsing {current_phase} response: {e}")
+                    release_data = json_response["default"]["responses"][2]["responseRows"][0]["dimensionCompoundValues"]
+                except (KeyError, IndexError, TypeError):
+                    release_data = None
+
+                if release_data:
+                    # Extract version - handle both string and dict formats
+                    version_data = release_data[0]
+                    if isinstance(version_data, dict) and 'value' in version_data:
+                        dominant_version = version_data['value']
+                    else:
+                        dominant_version = str(version_data)
+                    platform = "iOS" if phase == "ios_dominant_release" else "Android"
+                    log.debug("📱 %s Dominant Release: %s", platform, dominant_version)
+
+                    if phase == "ios_dominant_release":
+                        events["ios_dominant_release"].set()
+                        app_data["ios"]["dominant_release"] = dominant_version
+                    else:  # android_dominant_release
+                        events["android_dominant_release"].set()
+                        app_data["android"]["dominant_release"] = dominant_version
+            except Exception as e:
+                log.error("❌ Error parsing %s response: %s", phase, e)
+
+        async def _h_play_console_anrs(response, url, phase):
+            """Top user-perceived ANRs from Play Console error clusters"""
+            if play_console_app_id not in url:
+                return
 
-            # Handle Play Console ANR response
-            if (current_phase == "up_anrs" and
-                "playconsolehealth-pa.clients6.google.com" in url and
-                "errorClusters" in url and
-                app_config["android"]["play_console"]["app_id"] in url):
-                try:
-                    # Check if request body contains the required criteria
-                    request = response.request
-                    request_body = request.post_data
-
-                    if (request_body and
-                        '"19":2' in request_body and
-                        '"2":[3]' in request_body):
-                        json_response = await response.json()
-                        anr_data = json_response.get("1", [])
-
-                        # Group ANRs by name and merge data
-                        grouped_anrs = {}
-                        for anr in anr_data:
-                            anr_name = anr.get("2", {}).get("1", "Unknown")
-                            affected_users = int(anr.get("6", "0"))
-                            event_count = int(anr.get("7", "0"))
-                            impact_percentage = float(anr.get("11", 0)) * 100  # Convert to percentage
-
-                            if anr_name in grouped_anrs:
-                                grouped_anrs[anr_name]["affected_users"] += affected_users
-                                grouped_anrs[anr_name]["event_count"] += event_count
-                                grouped_anrs[anr_name]["impact_percentage"] += impact_percentage
-                            else:
-                                grouped_anrs[anr_name] = {
-                                    "affected_users": affected_users,
-                                    "event_count": event_count,
-                                    "impact_percentage": impact_percentage
-                                }
-
-                        # Sort by impact percentage and get top ANRs
-                        sorted_anrs = sorted(grouped_anrs.items(),
-                                           key=lambda x: x[1]["impact_percentage"], reverse=True)[:3]
-
-                        # Store in JSON structure
-                        anr_list = []
-                        for name, data in sorted_anrs:
-                            anr_list.append({
-                                "name": name,
-                                "impact_percentage": round(data["impact_percentage"], 2),
-                                "affected_users": data["affected_users"],
-                                "events": data["event_count"]
-                            })
-                        app_data["android"]["up_anrs"] = anr_list
-
-                        print(f"🎯 Top 3 Play Console User Perceived ANRs:")
+            try:
+                # Check if request body contains the required criteria
+                # (post data is read once; the rarer '"2":[3]' marker is tested first)
+                request_body = response.post_data
+
+                if (request_body and
+                    '"2":[3]' in request_body and
+                    '"19":2' in request_body):
+                    json_response = await _read_json(response)
+                    anr_data = json_response.get("1", [])
+
+                    # Group ANRs by name and merge data
+                    grouped_anrs = {}
+                    for anr in anr_data:
+                        anr_name = anr.get("2", {}).get("1", "Unknown")
+                        affected_users = _to_int(anr.get("6"))
+                        event_count = _to_int(anr.get("7"))
+                        impact_percentage = float(anr.get("11", 0)) * 100  # Convert to percentage
+
+                        grouped = grouped_anrs.setdefault(anr_name, {
+                            "affected_users": 0,
+                            "event_count": 0,
+                            "impact_percentage": 0.0
+                        })
+                        grouped["affected_users"] += affected_users
+                        grouped["event_count"] += event_count
+                        grouped["impact_percentage"] += impact_percentage
+
+                    # Get top ANRs by impact percentage
+                    sorted_anrs = heapq.nlargest(3, grouped_anrs.items(),
+                                                 key=lambda x: x[1]["impact_percentage"])
+
+                    # Store in JSON structure
+                    anr_list = []
+                    for name, data in sorted_anrs:
+                        anr_list.append({
+                            "name": name,
+                            "impact_percentage": round(data["impact_percentage"], 2),
+                            "affected_users": data["affected_users"],
+                            "events": data["event_count"]
+                        })
+                    app_data["android"]["up_anrs"] = anr_list
+
+                    if log.isEnabledFor(logging.DEBUG):
+                        lines = ["🎯 Top 3 Play Console User Perceived ANRs:"]
                         for i, (name, data) in enumerate(sorted_anrs, 1):
-                            print(f"  {i}. {name}")
-                            print(f"     Impact: {data['impact_percentage']:.2f}%")
-                            print(f"     Affected Users: {data['affected_users']}, Events: {data['event_count']}")
+                            lines.append(f"  {i}. {name}")
+                            lines.append(f"     Impact: {data['impact_percentage']:.2f}%")
+                            lines.append(f"     Affected Users: {data['affected_users']}, Events: {data['event_count']}")
+                        log.debug("\n".join(lines))
+
+                    events["play_console_anrs"].set()
+                    log.info("✅ Play Console ANR data captured!")
+            except Exception as e:
+                log.error("❌ Error parsing Play Console ANR response: %s", e)
+
+        async def _h_android_metrics(response, url, phase):
+            """Android crash-free rates and install counts"""
+            nonlocal fatal_installs, non_fatal_installs
+            if events["metrics"].is_set():
+                return
+            try:
+                json_response = await _read_json(response)
+
+                # Check if this response has valid date range
+                grouped_metrics = json_response.get("groupedMetrics", [])
+                first_intervals = grouped_metrics[0].get("intervalMetrics") if grouped_metrics else None
+                if (first_intervals and
+                    is_valid_date_range(first_intervals[0].get("startTime", ""),
+                                        first_intervals[0].get("endTime", ""))):
+
+                    # Extract crash-free rates
+                    non_fatal_rate = None
+                    fatal_rate = None
+
+                    for metric in grouped_metrics:
+                        interval_metrics = metric.get("intervalMetrics")
+                        if not interval_metrics:
+                            continue
+                        intervals = interval_metrics[0]
+                        fatality = metric.get("fatality")
+                        if fatality == "NON_FATAL":
+                            # Extract non-fatal crash-free rate
+                            ratio = intervals.get("crashlyticsEventFreeUsersCombined", _EMPTY_RATIO).get("ratio", 0)
+                            non_fatal_rate = round(ratio * 100, 2)  # Round to 2 decimal places
+                            non_fatal_installs = _to_int(intervals.get("totalCrashlyticsInstalls"))
+                        elif fatality == "FATAL":
+                            ratio = intervals.get("crashlyticsEventFreeUsersCombined", _EMPTY_RATIO).get("ratio", 0)
+                            fatal_rate = round(ratio * 100, 2)  # Round to 2 decimal places
+                            fatal_installs = _to_int(intervals.get("totalCrashlyticsInstalls"))
+
+                    log.debug("📊 NON_FATAL crash-free users rate: %s%%\n"
+                                 "📊 FATAL crash-free users rate: %s%%", non_fatal_rate, fatal_rate)
+
+                    # Store crash-free rates and install counts in JSON
+                    android = app_data["android"]
+                    android["crash_free_rates"] = {
+                        "fatal": fatal_rate,
+                        "non_fatal": non_fatal_rate
+                    }
+                    android["total_installs"] = {
+                        "fatal": fatal_installs,
+                        "non_fatal": non_fatal_installs
+                    }
 
-                        play_console_anrs_captured = True
-                        print("✅ Play Console ANR data captured!")
-                except Exception as e:
-                    print(f"❌ Error parsing Play Console ANR response: {e}")
+                    metrics_requests.append(url)
+                    events["metrics"].set()
+                    log.info("✅ Metrics captured, moving to crashes...")
+                else:
+                    log.debug("⏭️  Skipping - invalid date range or missing data")
+            except Exception as e:
+                log.error("❌ Error parsing JSON response: %s", e)
 
-            # Handle metrics report response
-            if not metrics_captured and re.search(r'metrics:getMetricsReport', url):
-                try:
-                    json_response = await response.json()
-
-                    # Check if this response has valid date range
-                    grouped_metrics = json_response.get("groupedMetrics", [])
-                    if (grouped_metrics and
-                        grouped_metrics[0].get("intervalMetrics") and
-                        is_valid_date_range(
-                            grouped_metrics[0]["intervalMetrics"][0].get("startTime", ""),
-                            grouped_metrics[0]["intervalMetrics"][0].get("endTime", ""))):
-
-                        # Extract crash-free rates
-                        non_fatal_rate = None
-                        fatal_rate = None
-
-                        for metric in grouped_metrics:
-                            fatality = metric.get("fatality")
-                            if fatality == "NON_FATAL" and metric.get("intervalMetrics"):
-                                # Extract non-fatal crash-free rate
-                                ratio = metric["intervalMetrics"][0].get("crashlyticsEventFreeUsersCombined", {}).get("ratio", 0)
-                                non_fatal_rate = round(ratio * 100, 2)  # Round to 2 decimal places
-                                non_fatal_installs = int(metric["intervalMetrics"][0].get("totalCrashlyticsInstalls", "0"))
-                            elif fatality == "FATAL" and metric.get("intervalMetrics"):
-                                ratio = metric["intervalMetrics"][0].get("crashlyticsEventFreeUsersCombined", {}).get("ratio", 0)
-                                fatal_rate = round(ratio * 100, 2)  # Round to 2 decimal places
-                                fatal_installs = int(metric["intervalMetrics"][0].get("totalCrashlyticsInstalls", "0"))
-
-                        print(f"📊 NON_FATAL crash-free users rate: {non_fatal_rate}%")
-                        print(f"📊 FATAL crash-free users rate: {fatal_rate}%")
-
-                        # Store crash-free rates and install counts in JSON
-                        app_data["android"]["crash_free_rates"] = {
-                            "fatal": fatal_rate,
-                            "non_fatal": non_fatal_rate
-                        }
-                        app_data["android"]["total_installs"] = {
-                            "fatal": fatal_installs,
-                            "non_fatal": non_fatal_installs
+        async def _h_anr_metrics(response, url, phase):
+            """ANR install count from the ANR page's metrics report"""
+            nonlocal anr_installs
+            try:
+                json_response = await _read_json(response)
+                grouped_metrics = json_response.get("groupedMetrics", [])
+                first_intervals = grouped_metrics[0].get("intervalMetrics") if grouped_metrics else None
+                if (first_intervals and
+                    is_valid_date_range(first_intervals[0].get("startTime", ""),
+                                        first_intervals[0].get("endTime", ""))):
+                    for metric in grouped_metrics:
+                        interval_metrics = metric.get("intervalMetrics")
+                        if metric.get("fatality") == "ANR" and interval_metrics:
+                            anr_installs = _to_int(interval_metrics[0].get("totalCrashlyticsInstalls"))
+                            events["anr_metrics"].set()
+                            # Don't change phase here - let main flow handle it
+                            break
+            except Exception as e:
+                log.error("❌ Error parsing ANR metrics JSON response: %s", e)
+
+        async def _h_ios_metrics(response, url, phase):
+            """iOS crash-free rates and install counts"""
+            nonlocal ios_fatal_installs, ios_non_fatal_installs
+            try:
+                json_response = await _read_json(response)
+                grouped_metrics = json_response.get("groupedMetrics", [])
+                first_intervals = grouped_metrics[0].get("intervalMetrics") if grouped_metrics else None
+                if (first_intervals and
+                    is_valid_date_range(first_intervals[0].get("startTime", ""),
+                                        first_intervals[0].get("endTime", ""))):
+                    ios = app_data["ios"]
+                    crash_rates = ios["crash_free_rates"]
+                    total_installs = ios["total_installs"]
+                    # Capture fatal on ios_crashes/ios_metrics and non-fatal on ios_non_fatals/ios_metrics, once each
+                    need_fatal = phase != "ios_non_fatals" and "fatal" not in crash_rates
+                    need_non_fatal = phase != "ios_crashes" and "non_fatal" not in crash_rates
+                    for metric in grouped_metrics:
+                        interval_metrics = metric.get("intervalMetrics")
+                        if not interval_metrics:
+                            continue
+                        intervals = interval_metrics[0]
+                        fatality = metric.get("fatality")
+                        if fatality == "FATAL":
+                            ios_fatal_installs = _to_int(intervals.get("totalCrashlyticsInstalls"))
+                            if need_fatal:
+                                ratio = intervals.get("crashlyticsEventFreeUsersCombined", _EMPTY_RATIO).get("ratio", 0)
+                                ios_fatal_rate = round(ratio * 100, 2)  # Round to 2 decimal places
+                                log.debug("📊 iOS FATAL crash-free users rate: %s%%", ios_fatal_rate)
+
+                                crash_rates["fatal"] = ios_fatal_rate
+                                total_installs["fatal"] = ios_fatal_installs
+                                need_fatal = False
+                        elif fatality == "NON_FATAL":
+                            ios_non_fatal_installs = _to_int(intervals.get("totalCrashlyticsInstalls"))
+                            if need_non_fatal:
+                                ratio = intervals.get("crashlyticsEventFreeUsersCombined", _EMPTY_RATIO).get("ratio", 0)
+                                ios_non_fatal_rate = round(ratio * 100, 2)  # Round to 2 decimal places
+                                log.debug("📊 iOS NON_FATAL crash-free users rate: %s%%", ios_non_fatal_rate)
+
+                                # Store iOS crash-free rates and installs
+                                crash_rates["non_fatal"] = ios_non_fatal_rate
+                                total_installs["non_fatal"] = ios_non_fatal_installs
+                                need_non_fatal = False
+
+                    if phase == "ios_metrics":
+                        events["ios_metrics"].set()
+                    elif phase == "ios_non_fatals":
+                        # Capture installs when on non-fatals page
+                        log.debug("📊 Captured iOS non-fatal installs: %s", ios_non_fatal_installs)
+                        events["ios_metrics"].set()  # Set event so issues handler work
+
+                        # Process any pending iOS non-fatal issues if they were captured before installs
+                        if ios_nonfatal_issues_processed:
+                            log.debug("🔄 Reprocessing iOS non-fatal impact with correct install count...")
+            except Exception as e:
+                error_msg = str(e)
+                # Don't print errors for responses that were already consumed
+                if "No resource with given identifier" not in error_msg and "Protocol error" not in error_msg:
+                    log.error("❌ Error parsing iOS metrics JSON response: %s", e)
+                # Still try to set the flag if we got fatal rate
+                if "fatal" in app_data["ios"]["crash_free_rates"]:
+                    events["ios_metrics"].set()
+
+        def top_issues_target(phase):
+            """(issue type, install count) for the top issues of `phase`, or None if they are not wanted now"""
+            nonlocal ios_nonfatal_issues_processed
+            if phase == "crashes" and not events["crashes"].is_set():
+                return "Crashes", fatal_installs
+            if phase == "non_fatals" and not events["non_fatals"].is_set():
+                return "Non-Fatal Issues", non_fatal_installs
+            if phase == "anrs" and events["anr_metrics"].is_set() and not events["anrs"].is_set():
+                return "ANRs", anr_installs
+            if phase == "ios_crashes" and events["ios_metrics"].is_set() and not events["ios_crashes"].is_set():
+                return "iOS Crashes", ios_fatal_installs
+            if phase == "ios_non_fatals" and events["ios_metrics"].is_set():
+                return "iOS Non-Fatal Issues", ios_non_fatal_installs  # Will be captured from metrics on this page
+            if phase == "ios_non_fatals":
+                # iOS non-fatal issues came before metrics - mark for later processing
+                ios_nonfatal_issues_processed = True
+                log.debug("⏳ iOS non-fatal issues detected before install count available - will process after metrics")
+            return None  # Skip if we're not in the right phase
+
+        def record_top_issues(json_response, phase, issue_type, total_installs):
+            """Store the top 3 issues of a top-issues payload for `phase`"""
+            # Phase-dependent grouping rules, decided once per response
+            is_ios = phase.startswith("ios")
+            group_by_title = is_ios or phase == "anrs"
+
+            # Group issues by subtitle and sum their metrics
+            grouped_issues = {}
+            for title, subtitle, impacted_devices, events_count in _iter_top_issues(json_response):
+                # Group by title for ANRs, by subtitle for Android only
+                if group_by_title:
+                    group_key = title
+                    display_title = title
+                else:
+                    group_key = subtitle
+                    display_title = subtitle if subtitle != "Unknown" else title
+
+                # Skip grouping for iOS - treat each issue individually
+                if is_ios:
+                    issue_key = f"{title}_{len(grouped_issues)}"  # Unique key for each issue
+                    # For iOS non-fatals, use subtitle; for iOS crashes, use title
+                    display_name = subtitle if phase == "ios_non_fatals" else title
+                    grouped_issues[issue_key] = {
+                        "title": display_name,
+                        "original_title": title,
+                        "subtitle": subtitle,
+                        "impactedDevicesCount": impacted_devices,
+                        "eventsCount": events_count
+                    }
+                else:
+                    entry = grouped_issues.get(group_key)
+                    if entry is None:
+                        entry = grouped_issues[group_key] = {
+                            "title": display_title,
+                            "original_title": title,
+                            "subtitle": subtitle,
+                            "impactedDevicesCount": 0,
+                            "eventsCount": 0
                         }
+                    entry["impactedDevicesCount"] += impacted_devices
+                    entry["eventsCount"] += events_count
+
+            # Sort by impacted devices count and get top 3
+            sorted_issues = heapq.nlargest(3, grouped_issues.values(),
+                                           key=lambda x: x["impactedDevicesCount"])
+
+            # Resolve the destination list once for this phase
+            platform, category = _TOP_ISSUE_TARGETS[phase]
+            issue_list = app_data[platform][category]
+
+            for i, issue in enumerate(sorted_issues, 1):
+                impact_percent = int(issue['impactedDevicesCount'] / total_installs * 100) if total_installs > 0 else 0
+
+                # Store in JSON structure
+                issue_data = {
+                    "rank": i,
+                    "name": issue['title'],
+                    "impact_percentage": impact_percent,
+                    "impacted_devices": issue['impactedDevicesCount'],
+                    "events": issue['eventsCount']
+                }
 
-                        metrics_requests.append(url)
-                        metrics_captured = True
-                        print("✅ Metrics captured, moving to crashes...")
-                    else:
-                        print(f"⏭️  Skipping - invalid date range or missing data")
-                except Exception as e:
-                    print(f"❌ Error parsing JSON response: {e}")
+                # Add to appropriate category
+                issue_list.append(issue_data)
+
+            if log.isEnabledFor(logging.DEBUG):
+                lines = [f"🏆 Top 3 {issue_type}:"]
+                for issue_data in issue_list:
+                    lines.append(f"  {issue_data['rank']}. {issue_data['name']}")
+                    lines.append(f"     Impact: {issue_data['impact_percentage']}%")
+                    lines.append(f"     Impacted Devices: {issue_data['impacted_devices']}, Events: {issue_data['events']}")
+                log.debug("\n".join(lines))
+
+            if phase == "crashes":
+                events["crashes"].set()
+            elif phase == "non_fatals":
+                events["non_fatals"].set()
+            elif phase == "anrs":
+                events["anrs"].set()
+                log.info("✅ Android data captured! Moving to iOS...")
+            elif phase == "ios_crashes":
+                events["ios_crashes"].set()
+            elif phase == "ios_non_fatals":
+                events["ios_non_fatals"].set()
+
+        async def _h_top_issues(response, url, phase):
+            """Top 3 issues for whichever issues page is open"""
+            target = top_issues_target(phase)
+            if target is None:
+                return
+            try:
+                record_top_issues(await _read_json(response), phase, *target)
+            except Exception as e:
+                log.error("❌ Error parsing JSON response: %s", e)
 
-            # Handle ANR metrics report response (separate call for ANR page)
-            elif current_phase == "anr_metrics" and re.search(r'metrics:getMetricsReport', url):
-                try:
-                    json_response = await response.json()
-                    grouped_metrics = json_response.get("groupedMetrics", [])
-                    if (grouped_metrics and
-                        grouped_metrics[0].get("intervalMetrics") and
-                        is_valid_date_range(
-                            grouped_metrics[0]["intervalMetrics"][0].get("startTime", ""),
-                            grouped_metrics[0]["intervalMetrics"][0].get("endTime", ""))):
-                        grouped_metrics = json_response.get("groupedMetrics", [])
-                        for metric in grouped_metrics:
-                            if metric.get("fatality") == "ANR" and metric.get("intervalMetrics"):
-                                anr_installs = int(metric["intervalMetrics"][0].get("totalCrashlyticsInstalls", "0"))
-                                anr_metrics_captured = True
-                                # Don't change phase here - let main flow handle it
-                                break
-                except Exception as e:
-                    print(f"❌ Error parsing ANR metrics JSON response: {e}")
+        async def _h_early_top_issues(response, url, phase):
+            """Top issues that finished loading before their phase started: kept until it does"""
+            try:
+                early_top_issues[_EARLY_TOP_ISSUES_PHASE[phase]] = await _read_json(response)
+            except Exception as e:
+                log.error("❌ Error parsing JSON response: %s", e)
+
+        # (phase, URL kind) -> handler; anything not listed is ignored
+        handlers = {
+            ("metrics", "metrics"): _h_android_metrics,
+            ("crashes", "top_issues"): _h_top_issues,
+            ("non_fatals", "top_issues"): _h_top_issues,
+            ("anr_metrics", "metrics"): _h_anr_metrics,
+            ("anr_metrics", "top_issues"): _h_early_top_issues,
+            ("anrs", "top_issues"): _h_top_issues,
+            ("ios_metrics", "metrics"): _h_ios_metrics,
+            ("ios_metrics", "top_issues"): _h_early_top_issues,
+            ("ios_crashes", "metrics"): _h_ios_metrics,
+            ("ios_crashes", "top_issues"): _h_top_issues,
+            ("ios_non_fatals", "metrics"): _h_ios_metrics,
+            ("ios_non_fatals", "top_issues"): _h_top_issues,
+            ("up_anrs", "play_console_anrs"): _h_play_console_anrs,
+            ("ios_dominant_release", "dominant_release"): _h_dominant_release,
+            ("android_dominant_release", "dominant_release"): _h_dominant_release,
+            ("android_p90_launch", "p90_launch"): _h_p90_launch,
+        }
 
-            # Handle iOS metrics report response
-            elif (current_phase == "ios_metrics" or current_phase == "ios_crashes" or current_phase == "ios_non_fatals") and re.search(r'metrics:getMetricsReport', url):
-                try:
-                    json_response = await response.json()
-                    grouped_metrics = json_response.get("groupedMetrics", [])
-                    if (grouped_metrics and
-                        grouped_metrics[0].get("intervalMetrics") and
-                        is_valid_date_range(
-                            grouped_metrics[0]["intervalMetrics"][0].get("startTime", ""),
-                            grouped_metrics[0]["intervalMetrics"][0].get("endTime", ""))):
-                        grouped_metrics = json_response.get("groupedMetrics", [])
-                        for metric in grouped_metrics:
-                            fatality = metric.get("fatality")
-                            if fatality == "FATAL" and metric.get("intervalMetrics"):
-                                ios_fatal_installs = int(metric["intervalMetrics"][0].get("totalCrashlyticsInstalls", "0"))
-                                # Capture fatal crash-free rate on both ios_crashes and ios_metrics phases
-                                if (current_phase in ["ios_crashes", "ios_metrics"] and
-                                    "fatal" not in app_data["ios"]["crash_free_rates"]):
-                                    ratio = metric["intervalMetrics"][0].get("crashlyticsEventFreeUsersCombined", {}).get("ratio", 0)
-                                    ios_fatal_rate = round(ratio * 100, 2)  # Round to 2 decimal places
-                                    print(f"📊 iOS FATAL crash-free users rate: {ios_fatal_rate}%")
-
-                                    app_data["ios"]["crash_free_rates"]["fatal"] = ios_fatal_rate
-                                    app_data["ios"]["total_installs"]["fatal"] = ios_fatal_installs
-                            elif fatality == "NON_FATAL" and metric.get("intervalMetrics"):
-                                ios_non_fatal_installs = int(metric["intervalMetrics"][0].get("totalCrashlyticsInstalls", "0"))
-                                # Capture non-fatal crash-free rate on both ios_non_fatals and ios_metrics phases
-                                if (current_phase in ["ios_non_fatals", "ios_metrics"] and
-                                    "non_fatal" not in app_data["ios"]["crash_free_rates"]):
-                                    ratio = metric["intervalMetrics"][0].get("crashlyticsEventFreeUsersCombined", {}).get("ratio", 0)
-                                    ios_non_fatal_rate = round(ratio * 100, 2)  # Round to 2 decimal places
-                                    print(f"📊 iOS NON_FATAL crash-free users rate: {ios_non_fatal_rate}%")
-
-                                    # Store iOS crash-free rates and installs
-                                    if "non_fatal" not in app_data["ios"]["crash_free_rates"]:
-                                        app_data["ios"]["crash_free_rates"]["non_fatal"] = ios_non_fatal_rate
-                                        app_data["ios"]["total_installs"]["non_fatal"] = ios_non_fatal_installs
-
-                        if current_phase == "ios_metrics":
-                            ios_metrics_captured = True
-                        elif current_phase == "ios_non_fatals":
-                            # Capture installs when on non-fatals page
-                            print(f"📊 Captured iOS non-fatal installs: {ios_non_fatal_installs}")
-                            ios_metrics_captured = True  # Set flag so issues handler work
-
-                            # Process any pending iOS non-fatal issues if they were captured before installs
-                            if ios_nonfatal_issues_processed:
-                                print("🔄 Reprocessing iOS non-fatal impact with correct install count...")
-                except Exception as e:
-                    error_msg = str(e)
-                    # Don't print errors for responses that were already consumed
-                    if "No resource with given identifier" not in error_msg and "Protocol error" not in error_msg:
-                        print(f"❌ Error parsing iOS metrics JSON response: {e}")
-                    # Still try to set the flag if we got fatal rate
-                    if "fatal" in app_data["ios"]["crash_free_rates"]:
-                        ios_metrics_captured = True
-
-            # Handle top issues response
-            elif re.search(r'metrics:listFirebaseTopOpenIssues', url):
-                if current_phase == "crashes" and not crashes_captured:
-                    issue_type = "Crashes"
-                    total_installs = fatal_installs
-                elif current_phase == "non_fatals" and not non_fatals_captured:
-                    issue_type = "Non-Fatal Issues"
-                    total_installs = non_fatal_installs
-                elif current_phase == "anrs" and anr_metrics_captured:
-                    issue_type = "ANRs"
-                    total_installs = anr_installs
-                elif current_phase == "ios_crashes" and ios_metrics_captured:
-                    issue_type = "iOS Crashes"
-                    total_installs = ios_fatal_installs
-                elif current_phase == "ios_non_fatals" and ios_metrics_captured:
-                    issue_type = "iOS Non-Fatal Issues"
-                    total_installs = ios_non_fatal_installs  # Will be captured from metrics on this page
-                elif current_phase == "ios_non_fatals" and not ios_metrics_captured:
-                    # iOS non-fatal issues came before metrics - mark for later processing
-                    ios_nonfatal_issues_processed = True
-                    print("⏳ iOS non-fatal issues detected before install count available - will process after metrics")
-                    return
-                else:
-                    return  # Skip if we're not in the right phase
+        def handle_response(response):
+            """Pick the handler for a response by the phase it finished loading in, not the one it is processed in"""
+            if response.loader_id is not None and response.loader_id == left_loader_id:
+                return None  # Sent by the page this phase navigated away from
+            url = response.url
+            phase = current_phase
+            handler = handlers.get((phase, _classify_url(url)))
+            if handler is not None:
+                return handler(response, url, phase)
+            return None
 
+        def start_phase(phase, left_loader=None):
+            """
+            Switch to `phase`, crediting it with any top issues that finished loading early
+            left_loader is the document being navigated away from; its late responses are ignored
+            """
+            nonlocal current_phase, left_loader_id
+            current_phase = phase
+            left_loader_id = left_loader
+            json_response = early_top_issues.pop(phase, None)
+            target = top_issues_target(phase) if json_response is not None else None
+            if target is not None:
                 try:
-                    json_response = await response.json()
-                    top_issues = json_response.get("topIssues", [])
-
-                    # Group issues by subtitle and sum their metrics
-                    grouped_issues = {}
-                    for issue in top_issues:
-                        caption = issue.get("caption", {})
-                        subtitle = caption.get("subtitle", "Unknown")
-                        title = caption.get("title", "Unknown")
-
-                        impacted_devices = int(issue.get("impactedDevicesCount", "0"))
-                        events_count = int(issue.get("eventsCount", "0"))
-
-                        # Group by title for ANRs, by subtitle for Android only
-                        if current_phase == "anrs" or current_phase.startswith("ios"):
-                            group_key = title
-                            display_title = title
-                        else:
-                            group_key = subtitle
-                            display_title = subtitle if subtitle != "Unknown" else title
-
-                        # Skip grouping for iOS - treat each issue individually
-                        if current_phase.startswith("ios"):
-                            issue_key = f"{title}_{len(grouped_issues)}"  # Unique key for each issue
-                            # For iOS non-fatals, use subtitle; for iOS crashes, use title
-                            display_name = subtitle if current_phase == "ios_non_fatals" else title
-                            grouped_issues[issue_key] = {
-                                "title": display_name,
-                                "original_title": title,
-                                "subtitle": subtitle,
-                                "impactedDevicesCount": impacted_devices,
-                                "eventsCount": events_count
-                            }
-                        else:
-                            if group_key in grouped_issues:
-                                grouped_issues[group_key]["impactedDevicesCount"] += impacted_devices
-                                grouped_issues[group_key]["eventsCount"] += events_count
-                            else:
-                                grouped_issues[group_key] = {
-                                    "title": display_title,
-                                    "original_title": title,
-                                    "subtitle": subtitle,
-                                    "impactedDevicesCount": impacted_devices,
-                                    "eventsCount": events_count
-                                }
-
-                    # Sort by impacted devices count and get top 3
-                    sorted_issues = sorted(grouped_issues.values(),
-                                         key=lambda x: x["impactedDevicesCount"], reverse=True)[:3]
-
-                    print(f"🏆 Top 3 {issue_type}:")
-                    for i, issue in enumerate(sorted_issues, 1):
-                        impact_percent = int(issue['impactedDevicesCount'] / total_installs * 100) if total_installs > 0 else 0
-
-                        # Store in JSON structure
-                        issue_data = {
-                            "rank": i,
-                            "name": issue['title'],
-                            "impact_percentage": impact_percent,
-                            "impacted_devices": issue['impactedDevicesCount'],
-                            "events": issue['eventsCount']
-                        }
-
-                        # Add to appropriate category
-                        if current_phase == "crashes":
-                            app_data["android"]["top_crashes"].append(issue_data)
-                        elif current_phase == "non_fatals":
-                            app_data["android"]["top_non_fatals"].append(issue_data)
-                        elif current_phase == "anrs":
-                            app_data["android"]["all_anrs"].append(issue_data)
-                        elif current_phase == "ios_crashes":
-                            app_data["ios"]["top_crashes"].append(issue_data)
-                        elif current_phase == "ios_non_fatals":
-                            app_data["ios"]["top_non_fatals"].append(issue_data)
-
-                        print(f"  {i}. {issue['title']}")
-                        print(f"     Impact: {impact_percent}%")
-                        print(f"     Impacted Devices: {issue['impactedDevicesCount']}, Events: {issue['eventsCount']}")
-
-                    if current_phase == "crashes":
-                        crashes_captured = True
-                    elif current_phase == "non_fatals":
-                        non_fatals_captured = True
-                    elif current_phase == "anrs":
-                        print("✅ Android data captured! Moving to iOS...")
-                    elif current_phase == "ios_crashes":
-                        ios_crashes_captured = True
-                    elif current_phase == "ios_non_fatals":
-                        ios_non_fatals_captured = True
-
+                    record_top_issues(json_response, phase, *target)
                 except Exception as e:
-                    print(f"❌ Error parsing JSON response: {e}")
-
-        page.on("response", handle_response)
-
-        await page.goto(firebase_url, timeout=60000)
-
+                    log.error("❌ Error parsing JSON response: %s", e)
 
-        # Wait for metrics to be captured
-        while not metrics_captured:
-            await asyncio.sleep(1)
-
-        await asyncio.sleep(2)
-
-        current_phase = "crashes"
-        await page.goto(top_crashes_url)
-
-        # Wait for crashes to be captured
-        while not crashes_captured:
-            await asyncio.sleep(1)
-
-        current_phase = "non_fatals"
-        await asyncio.sleep(3)  # Wait before navigation
-        await page.goto(top_non_fatals_url)
+        async def wait_for_phase(name, label, timeout_seconds=PHASE_TIMEOUT_SECONDS):
+            """Wait until handle_response signals `name`; on timeout warn and carry on"""
+            watchdog = asyncio.create_task(_watchdog(events[name], label, prefix=f"{tag} "))
+            try:
+                await asyncio.wait_for(events[name].wait(), timeout=timeout_seconds)
+            except asyncio.TimeoutError:
+                print(f"{tag} ⚠️  Timeout waiting for {label} after {timeout_seconds}s, continuing...")
+                # Set the event anyway so handlers gated on it keep working
+                events[name].set()
+            finally:
+                watchdog.cancel()
+
+        async def run_phase(phase, url, label, event_name=None):
+            """Switch to `phase`, open its page and wait for its data; the next phase starts right after"""
+            start_phase(phase, await current_loader_id())
+            await page.goto(url)
+            await wait_for_phase(event_name or phase, label)
+
+        async def current_loader_id():
+            """loaderId of the document currently in the page's main frame"""
+            try:
+                frame_tree = await cdp.send("Page.getFrameTree")
+                return frame_tree["frameTree"]["frame"].get("loaderId")
+            except Exception:
+                return None
 
-        # Wait for non-fatals to be captured
-        while not non_fatals_captured:
-            await asyncio.sleep(1)
+        cdp = await _listen_for_responses(page, handle_response)
 
-        current_phase = "anr_metrics"
-        await asyncio.sleep(3)  # Wait before navigation
-        await page.goto(top_anrs_url)
+        await run_phase("metrics", firebase_url, "metrics")
+        await run_phase("crashes", top_crashes_url, "crashes")
+        await run_phase("non_fatals", top_non_fatals_url, "non-fatals")
+        await run_phase("anr_metrics", top_anrs_url, "ANR metrics")
 
-        # Wait for ANRs to be captured, then move to iOS
-        while not anr_metrics_captured:
-            await asyncio.sleep(1)
-        
-        # Change phase after metrics are captured
-        current_phase = "anrs"
+        # ANR issues load on the same page right after its metrics
+        start_phase("anrs")
+        await wait_for_phase("anrs", "ANRs", timeout_seconds=ANRS_TIMEOUT_SECONDS)
 
         # Start iOS data collection (only if app has iOS)
-        if app_config.get("has_ios") and ios_crashes_url:
-            print("\n📱 Starting iOS data collection...")
-            await asyncio.sleep(3)
-            current_phase = "ios_metrics"
+        if app_config.has_ios and ios_crashes_url:
+            print(f"\n{tag} 📱 Starting iOS data collection...")
+            start_phase("ios_metrics", await current_loader_id())
             await page.goto(ios_crashes_url)
 
+            # Reload once, and only if the first load produced no usable metrics
+            try:
+                await asyncio.wait_for(events["ios_metrics"].wait(), timeout=IOS_FIRST_LOAD_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                print(f"{tag} 🔄 No iOS metrics yet, reloading...")
+                await page.reload()
 
-            # Multiple refresh attempts to ensure data loading
-            await asyncio.sleep(3)
-            await page.reload()
-
-            await asyncio.sleep(2)
-            await page.reload()
+            # Wait for iOS metrics, then get crashes and non-fatals
+            # (crashes loaded alongside the metrics are credited when ios_crashes starts)
+            await wait_for_phase("ios_metrics", "iOS metrics")
 
-            # Clear any cached state by evaluating JavaScript
-            await page.evaluate("() => { window.location.reload(true); }")
+            start_phase("ios_crashes")
+            await wait_for_phase("ios_crashes", "iOS crashes")
 
-            # Wait for iOS metrics, then get crashes and non-fatals
-            timeout_seconds = 120
-            elapsed = 0
-            while not ios_metrics_captured and elapsed < timeout_seconds:
-                await asyncio.sleep(1)
-                elapsed += 1
-                if elapsed % 10 == 0:
-                    print(f"   Still waiting for iOS metrics... ({elapsed}s)")
-            if not ios_metrics_captured:
-                print(f"⚠️  Timeout waiting for iOS metrics after {timeout_seconds}s, continuing...")
-                # Set flag to continue even if metrics weren't captured
-                ios_metrics_captured = True
-
-            current_phase = "ios_crashes"
-            
-            elapsed = 0
-            while not ios_crashes_captured and elapsed < timeout_seconds:
-                await asyncio.sleep(1)
-                elapsed += 1
-                if elapsed % 10 == 0:
-                    print(f"   Still waiting for iOS crashes... ({elapsed}s)")
-            if not ios_crashes_captured:
-                print(f"⚠️  Timeout waiting for iOS crashes after {timeout_seconds}s, continuing...")
-                ios_crashes_captured = True
-
-            current_phase = "ios_non_fatals"
-            await asyncio.sleep(3)
-            await page.goto(ios_non_fatals_url)
-
-            # Wait for iOS non-fatals to be captured
-            elapsed = 0
-            while not ios_non_fatals_captured and elapsed < timeout_seconds:
-                await asyncio.sleep(1)
-                elapsed += 1
-                if elapsed % 10 == 0:
-                    print(f"   Still waiting for iOS non-fatals... ({elapsed}s)")
-            if not ios_non_fatals_captured:
-                print(f"⚠️  Timeout waiting for iOS non-fatals after {timeout_seconds}s, continuing...")
-                ios_non_fatals_captured = True
+            await run_phase("ios_non_fatals", ios_non_fatals_url, "iOS non-fatals")
 
         # Move to Play Console ANR collection
-        print("\n🎯 Starting Play Console ANR data collection...")
-        current_phase = "up_anrs"
-        await asyncio.sleep(3)
-        await page.goto(play_console_anr_url)
-
-        # Wait for Play Console ANRs to be captured
-        timeout_seconds = 120
-        elapsed = 0
-        while not play_console_anrs_captured and elapsed < timeout_seconds:
-            await asyncio.sleep(1)
-            elapsed += 1
-            if elapsed % 10 == 0:
-                print(f"   Still waiting for Play Console ANRs... ({elapsed}s)")
-        if not play_console_anrs_captured:
-            print(f"⚠️  Timeout waiting for Play Console ANRs after {timeout_seconds}s, continuing...")
-            play_console_anrs_captured = True
+        print(f"\n{tag} 🎯 Starting Play Console ANR data collection...")
+        await run_phase("up_anrs", play_console_anr_url, "Play Console ANRs", event_name="play_console_anrs")
 
         # Move to iOS Dominant Release collection (only if app has iOS)
-        if app_config.get("has_ios") and ios_dominant_release_url:
-            print("\n📱 Starting iOS Dominant Release data collection...")
-            current_phase = "ios_dominant_release"
-            await asyncio.sleep(3)
-            await page.goto(ios_dominant_release_url)
-            # Wait for iOS dominant release to be captured
-            elapsed = 0
-            while not ios_dominant_release_captured and elapsed < timeout_seconds:
-                await asyncio.sleep(1)
-                elapsed += 1
-                if elapsed % 10 == 0:
-                    print(f"   Still waiting for iOS dominant release... ({elapsed}s)")
-            if not ios_dominant_release_captured:
-                print(f"⚠️  Timeout waiting for iOS dominant release after {timeout_seconds}s, continuing...")
-                ios_dominant_release_captured = True
+        if app_config.has_ios and ios_dominant_release_url:
+            print(f"\n{tag} 📱 Starting iOS Dominant Release data collection...")
+            await run_phase("ios_dominant_release", ios_dominant_release_url, "iOS dominant release")
 
         # Move to Android Dominant Release collection
         if android_dominant_release_url:
-            print("\n🤖 Starting Android Dominant Release data collection...")
-            current_phase = "android_dominant_release"
-            await asyncio.sleep(3)
-            await page.goto(android_dominant_release_url)
-
-            # Wait for Android dominant release to be captured
-            elapsed = 0
-            while not android_dominant_release_captured and elapsed < timeout_seconds:
-                await asyncio.sleep(1)
-                elapsed += 1
-                if elapsed % 10 == 0:
-                    print(f"   Still waiting for Android dominant release... ({elapsed}s)")
-            if not android_dominant_release_captured:
-                print(f"⚠️  Timeout waiting for Android dominant release after {timeout_seconds}s, continuing...")
-                android_dominant_release_captured = True
+            print(f"\n{tag} 🤖 Starting Android Dominant Release data collection...")
+            await run_phase("android_dominant_release", android_dominant_release_url, "Android dominant release")
 
         # Move to Android P90 Launch Time collection (only if app has it)
-        if app_config.get("has_p90_launch_time", True) and android_p90_launch_url:
-            print("\n⚡ Starting Android P90 Launch Time data collection...")
-            current_phase = "android_p90_launch"
-            await asyncio.sleep(3)
-            await page.goto(android_p90_launch_url)
-
-            # Wait for Android P90 launch time to be captured
-            elapsed = 0
-            while not android_p90_launch_captured and elapsed < timeout_seconds:
-                await asyncio.sleep(1)
-                elapsed += 1
-                if elapsed % 10 == 0:
-                    print(f"   Still waiting for Android P90 launch time... ({elapsed}s)")
-            if not android_p90_launch_captured:
-                print(f"⚠️  Timeout waiting for Android P90 launch time after {timeout_seconds}s, continuing...")
-                android_p90_launch_captured = True
-
-        # Automatically fetch Google Play Vitals data
-        if GOOGLE_PLAY_AVAILABLE:
-            print("\n📊 Fetching Google Play Vitals data...")
-            vitals_data = get_google_play_vitals(report_days, app_config["android"]["package_name"])
-            if vitals_data:
-                app_data["google_play_vitals"] = vitals_data
-                print("✅ Google Play Vitals data added successfully!")
-                print(f"   ANR Rate: {vitals_data.get('anr_rate', 'N/A')}")
-                print(f"   User ANR Rate: {vitals_data.get('user_perceived_anr_rate', 'N/A')}")
-                print(f"   Crash Rate: {vitals_data.get('crash_rate', 'N/A')}")
-                print(f"   User Crash Rate: {vitals_data.get('user_perceived_crash_rate', 'N/A')}")
-                print(f"   Slow Start Rate: {vitals_data.get('slow_start_rate', 'N/A')}")
-            else:
-                print("⚠️  Google Play Vitals data could not be retrieved")
-        
-        print(f"✅ Data collection complete for {app_config['name']}!")
+        if app_config.has_p90_launch_time and android_p90_launch_url:
+            print(f"\n{tag} ⚡ Starting Android P90 Launch Time data collection...")
+            await run_phase("android_p90_launch", android_p90_launch_url, "Android P90 launch time")
+
+        print(f"✅ Data collection complete for {app_config.name}!")
         return app_data
 
     except Exception as e:
-        print(f"❌ Error collecting data for {app_config['name']}: {e}")
+        print(f"❌ Error collecting data for {app_config.name}: {e}")
         return None
 
 async def open_firebase_console(report_days: int):
@@ -1079,6 +1358,7 @@ async def open_firebase_console(report_days: int):
     Collect vitals data for all apps in APPS_CONFIG
     """
     browser = None
+    vitals_task = None
     try:
         # Create a browser instance and get a page
         # Create user data directory for session persistence
@@ -1086,7 +1366,8 @@ async def open_firebase_console(report_days: int):
         os.makedirs(user_data_dir, exist_ok=True)
         browser_config = {
             "user_data_dir": user_data_dir,
-            "extensions": []  # Disable extensions to avoid download/extraction delays
+            "extensions": [],  # Disable extensions to avoid download/extraction delays
+            "args": _CHROMIUM_ARGS
         }
         browser = Browser(**browser_config)
         
@@ -1118,11 +1399,8 @@ async def open_firebase_console(report_days: int):
         
         print("✅ Page obtained")
         
-        # Set timeouts and disable heavy resources
-        page.set_default_timeout(60000)  # 60 second timeout
-        await page.route("**/*.{png,jpg,jpeg,gif,svg,ico}", lambda route: route.abort())  # Block images
-        await page.route("**/*.{css,woff,woff2,ttf}", lambda route: route.abort())  # Block fonts/CSS
-        print("✅ Page configured")
+        # Apps are collected in tabs of their own, so only the context is kept
+        context = page.context
         
         # Initialize final data structure
         all_apps_data = {
@@ -1131,13 +1409,55 @@ async def open_firebase_console(report_days: int):
             "apps": {}
         }
         
-        # Collect data for each app
-        for app_key, app_config in APPS_CONFIG.items():
-            app_data = await collect_app_data(report_days, app_key, app_config, page)
+        # Fetch Google Play Vitals for all apps in the background while the browser works
+        if GOOGLE_PLAY_AVAILABLE:
+            print("\n📊 Fetching Google Play Vitals data...")
+            vitals_task = asyncio.create_task(fetch_all_google_play_vitals(report_days))
+
+        # Collect data for every app in parallel, one tab per app
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_APPS)
+
+        async def collect_in_new_tab(app_key, app_config):
+            """Collect one app in its own tab; a failure only loses that app's data"""
+            async with semaphore:
+                app_page = None
+                try:
+                    app_page = await context.new_page()
+                    # Set timeouts and disable heavy resources
+                    await _configure_page(app_page)
+                    return await collect_app_data(report_days, app_key, app_config, app_page)
+                except Exception as e:
+                    print(f"❌ Error collecting data for {app_config.name} ({app_key}): {e}")
+                    return None
+                finally:
+                    if app_page is not None:
+                        try:
+                            await app_page.close()
+                        except Exception:
+                            pass
+
+        results = await asyncio.gather(
+            *(collect_in_new_tab(app_key, app_config) for app_key, app_config in APPS_CONFIG.items())
+        )
+        for app_key, app_data in zip(APPS_CONFIG, results):
             if app_data:
                 all_apps_data["apps"][app_key] = app_data
-                # Reset flags for next app
-                await asyncio.sleep(2)  # Brief pause between apps
+
+        # Attach Google Play Vitals data
+        if vitals_task:
+            all_vitals = await vitals_task
+            for app_key, app_data in all_apps_data["apps"].items():
+                vitals_data = all_vitals.get(app_key)
+                if vitals_data:
+                    app_data["google_play_vitals"] = vitals_data
+                    print(f"✅ Google Play Vitals data added for {app_data['app_name']}!")
+                    print(f"   ANR Rate: {vitals_data.get('anr_rate', 'N/A')}")
+                    print(f"   User ANR Rate: {vitals_data.get('user_perceived_anr_rate', 'N/A')}")
+                    print(f"   Crash Rate: {vitals_data.get('crash_rate', 'N/A')}")
+                    print(f"   User Crash Rate: {vitals_data.get('user_perceived_crash_rate', 'N/A')}")
+                    print(f"   Slow Start Rate: {vitals_data.get('slow_start_rate', 'N/A')}")
+                else:
+                    print(f"⚠️  Google Play Vitals data could not be retrieved for {app_data['app_name']}")
         
         print("\n" + "="*60)
         print("✅ All data collection complete!")
@@ -1146,8 +1466,8 @@ async def open_firebase_console(report_days: int):
         # Save data to JSON file
         output_filename = f"crash_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         try:
-            with open(output_filename, 'w') as f:
-                json.dump(all_apps_data, f, indent=2)
+            with open(output_filename, 'wb') as f:
+                f.write(_json_dumps_pretty(all_apps_data))
             print(f"📄 Data saved to {output_filename}")
         except Exception as e:
             print(f"❌ Error saving data to file: {e}")
@@ -1172,6 +1492,8 @@ async def open_firebase_console(report_days: int):
     except Exception as e:
         print(f"Error: {e}")
     finally:
+        if vitals_task and not vitals_task.done():
+            vitals_task.cancel()
         # Clean up browser
         if browser:
             try:
@@ -1193,7 +1515,15 @@ async def simple_open_url():
     print("Done!")
 
 if __name__ == "__main__":
-      days = _choose_report_days()
+      # LOG_LEVEL=DEBUG shows every parsed value as it arrives; INFO keeps progress and the summary.
+      # Configured on our own logger: importing browser_use already put a handler on the root logger
+      # (so basicConfig would be a no-op), and its level/format must not apply to these lines
+      handler = logging.StreamHandler(sys.stdout)
+      handler.setFormatter(logging.Formatter("%(message)s"))
+      logger.addHandler(handler)
+      logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+      logger.propagate = False
+      days = REPORT_DAYS
       # Reflect selection globally for date validations
       DATE_RANGE_DAYS = days
       print(f"🚀 Starting App Vitals Collection ({days}-day period)")
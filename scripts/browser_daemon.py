@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Long-lived browser for the helper scripts
+Keeps one browser_use Browser (same profile as automate_vitals.py) running and
+accepts JSON commands on a Unix socket, so save_session.py can skip the browser cold start
+"""
+
+import asyncio
+import json
+import os
+import socket
+from pathlib import Path
+from browser_use import Browser
+
+USER_DATA_DIR = os.path.expanduser("~/.browser_use_firebase")
+SOCKET_PATH = os.path.join(USER_DATA_DIR, "ctl.sock")
+
+
+async def send_command(command: dict) -> dict:
+    """
+    Send one command to a running daemon and return its reply
+    Raises OSError (e.g. FileNotFoundError, ConnectionRefusedError) if no daemon is listening,
+    including on platforms without Unix sockets
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("Unix sockets are not supported on this platform")
+    reader, writer = await asyncio.open_unix_connection(SOCKET_PATH)
+    try:
+        writer.write(json.dumps(command).encode() + b"\n")
+        await writer.drain()
+        line = await reader.readline()
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    if not line:
+        raise ConnectionError("Browser daemon closed the connection without replying")
+    return json.loads(line)
+
+
+class BrowserDaemon:
+    """Owns the browser and executes one command at a time"""
+
+    def __init__(self):
+        self.browser = None
+        self.page = None
+        self.stopped = asyncio.Event()
+        self.lock = asyncio.Lock()
+
+    async def start(self):
+        self.browser = Browser(
+            user_data_dir=USER_DATA_DIR,
+            extensions=[]  # Disable extensions to avoid download/extraction delays
+        )
+        await self.browser.start()
+        await self.browser.navigate_to("about:blank")
+        self.page = await self.browser.get_current_page()
+        if self.page is None:
+            raise RuntimeError("Failed to get page from browser. Browser may not have started properly.")
+
+    async def close(self):
+        if self.browser:
+            try:
+                await self.browser.close()
+            except Exception:
+                pass
+
+    async def handle_command(self, command: dict) -> dict:
+        op = command.get("op")
+        if op == "ping":
+            return {"ok": True}
+        if op == "goto":
+            await self.page.goto(command["url"], wait_until="domcontentloaded", timeout=command.get("timeout", 30000))
+            return {"ok": True, "url": self.page.url}
+        if op == "current_url":
+            return {"ok": True, "url": self.page.url}
+        if op == "save_storage":
+            storage_path = Path(command["path"])
+            storage_path.parent.mkdir(parents=True, exist_ok=True)
+            await self.browser.save_storage_state(storage_path)
+            return {"ok": True, "path": str(storage_path)}
+        if op == "shutdown":
+            self.stopped.set()
+            return {"ok": True}
+        return {"ok": False, "error": f"Unknown op: {op!r}"}
+
+    async def handle_client(self, reader, writer):
+        try:
+            line = await reader.readline()
+            if not line:
+                return
+            try:
+                command = json.loads(line)
+                # Commands share one page, so run them one at a time
+                async with self.lock:
+                    reply = await self.handle_command(command)
+            except Exception as e:
+                reply = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            writer.write(json.dumps(reply).encode() + b"\n")
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self):
+        os.makedirs(USER_DATA_DIR, exist_ok=True)
+        if os.path.exists(SOCKET_PATH):
+            # Never take over from a live daemon: it holds the browser profile
+            try:
+                await send_command({"op": "ping"})
+            except OSError:
+                # Left behind by a daemon that did not shut down cleanly
+                os.unlink(SOCKET_PATH)
+            else:
+                print(f"❌ A browser daemon is already listening on {SOCKET_PATH}")
+                raise SystemExit(1)
+
+        print("🔧 Starting browser...")
+        await self.start()
+        print("✅ Browser started")
+
+        server = await asyncio.start_unix_server(self.handle_client, path=SOCKET_PATH)
+        os.chmod(SOCKET_PATH, 0o600)
+        print(f"🔌 Listening on {SOCKET_PATH} (send {{\"op\": \"shutdown\"}} or press Ctrl+C to stop)")
+        try:
+            async with server:
+                await self.stopped.wait()
+        finally:
+            await self.close()
+            if os.path.exists(SOCKET_PATH):
+                os.unlink(SOCKET_PATH)
+            print("👋 Browser daemon stopped")
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(BrowserDaemon().serve())
+    except KeyboardInterrupt:
+        pass
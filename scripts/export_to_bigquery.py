@@ -4,9 +4,15 @@ Export app vitals JSON data to BigQuery
 Transforms the JSON structure to one row per app per collection
 """
 
+import gzip
 import json
+import os
 import sys
-from typing import List, Dict, Any
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Iterator
 
 try:
     from google.cloud import bigquery
@@ -16,6 +22,79 @@ except ImportError:
     BIGQUERY_AVAILABLE = False
     print("⚠️  BigQuery client not available. Install with: pip install google-cloud-bigquery")
 
+# Streaming JSON parsing for the input file, one app at a time (optional)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Fast JSON parsing for the input file (optional, falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# BigQuery Storage Write API (optional, falls back to an NDJSON load job)
+try:
+    from google.cloud import bigquery_storage_v1
+    from google.cloud.bigquery_storage_v1 import types as storage_types
+    from google.cloud.bigquery_storage_v1 import writer as storage_writer
+    from google.protobuf import descriptor_pb2, descriptor_pool, json_format, message_factory
+    STORAGE_WRITE_AVAILABLE = True
+except ImportError:
+    STORAGE_WRITE_AVAILABLE = False
+
+
+# Upload backends: Storage Write API appends, or one NDJSON batch load job
+BACKENDS = ('storage-write', 'load-job')
+
+# Rows pulled from the transform per upload batch
+BATCH_SIZE = 500
+
+# Serialized bytes per AppendRows request (the API caps a request at 10 MB)
+APPEND_BATCH_BYTES = 4 * 1024 * 1024
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_MICROSECOND = timedelta(microseconds=1)
+
+# Compressed NDJSON kept in memory before spilling to a temp file
+NDJSON_SPOOL_BYTES = 8 * 1024 * 1024
+
+# BigQuery column type -> proto2 field type (TIMESTAMP is epoch micros, DATE is epoch days)
+_PROTO_TYPES = {
+    'STRING': 'TYPE_STRING',
+    'INTEGER': 'TYPE_INT64',
+    'INT64': 'TYPE_INT64',
+    'FLOAT': 'TYPE_DOUBLE',
+    'FLOAT64': 'TYPE_DOUBLE',
+    'BOOLEAN': 'TYPE_BOOL',
+    'BOOL': 'TYPE_BOOL',
+    'TIMESTAMP': 'TYPE_INT64',
+    'DATE': 'TYPE_INT32',
+}
+
+# Column types with no native proto type: sent as their string form in a TYPE_STRING field
+_STRING_ENCODED_TYPES = frozenset(('NUMERIC', 'BIGNUMERIC', 'DATETIME', 'TIME', 'GEOGRAPHY'))
+
+
+# Marks an app entry without an 'error' key (an explicit {"error": None} is still an error)
+_NO_ERROR = object()
+
+# Google Play Vitals fields exported as metric_name/metric_value pairs
+_METRIC_FIELDS = (
+    'anr_rate',
+    'user_perceived_anr_rate',
+    'crash_rate',
+    'user_perceived_crash_rate',
+    'slow_start_rate',
+    'excessive_wakeup_rate',
+    'stuck_wakelock_rate',
+    'user_perceived_lmk_rate'
+)
+
 
 def transform_google_play_vitals(vitals_data: Dict[str, Any] | None) -> Dict[str, Any] | None:
     """Transform Google Play Vitals to key-value metrics array"""
@@ -24,22 +103,12 @@ def transform_google_play_vitals(vitals_data: Dict[str, Any] | None) -> Dict[str
     
     # Convert the flat structure to key-value pairs
     metrics = []
-    metric_fields = [
-        'anr_rate',
-        'user_perceived_anr_rate',
-        'crash_rate',
-        'user_perceived_crash_rate',
-        'slow_start_rate',
-        'excessive_wakeup_rate',
-        'stuck_wakelock_rate',
-        'user_perceived_lmk_rate'
-    ]
-    
-    for field in metric_fields:
-        if field in vitals_data and vitals_data[field] is not None:
+    for field in _METRIC_FIELDS:
+        value = vitals_data.get(field)
+        if value is not None:
             metrics.append({
                 'metric_name': field,
-                'metric_value': float(vitals_data[field])
+                'metric_value': value if type(value) is float else float(value)
             })
     
     return {
@@ -48,10 +117,31 @@ def transform_google_play_vitals(vitals_data: Dict[str, Any] | None) -> Dict[str
     }
 
 
+# App name mapping (for files where app_name is not in the output JSON)
+_APP_NAMES = {
+    'partner': 'Partner App',
+    'customer': 'Customer App',
+    'vendor': 'Vendor App',
+    'owner': 'Owner App'
+}
+
+# Fields of the android / ios records in the BigQuery schema
+_ANDROID_KEYS = frozenset((
+    'crash_free_rates', 'total_installs', 'p90_launch_time_seconds', 'dominant_release',
+    'top_crashes', 'top_non_fatals', 'all_anrs', 'up_anrs'
+))
+_IOS_KEYS = frozenset((
+    'crash_free_rates', 'total_installs', 'dominant_release', 'top_crashes', 'top_non_fatals'
+))
+
+
 def normalize_android_data(android_data: Dict[str, Any]) -> Dict[str, Any]:
     """Normalize Android data to match BigQuery schema exactly"""
     if not android_data:
         return {}
+    if android_data.keys() == _ANDROID_KEYS:
+        # Already exactly the schema's fields
+        return android_data
     
     normalized = {
         'crash_free_rates': android_data.get('crash_free_rates', {}),
@@ -71,6 +161,9 @@ def normalize_ios_data(ios_data: Dict[str, Any]) -> Dict[str, Any]:
     """Normalize iOS data to match BigQuery schema exactly"""
     if not ios_data:
         return {}
+    if ios_data.keys() == _IOS_KEYS:
+        # Already exactly the schema's fields
+        return ios_data
     
     normalized = {
         'crash_free_rates': ios_data.get('crash_free_rates', {}),
@@ -83,59 +176,268 @@ def normalize_ios_data(ios_data: Dict[str, Any]) -> Dict[str, Any]:
     return normalized
 
 
-def transform_json_to_bigquery_rows(json_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+def transform_json_to_bigquery_rows(json_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
     """
     Transform JSON structure from:
     {timestamp, date_range_days, apps: {app_key: {...}}}
     
-    To BigQuery rows (one per app):
+    To BigQuery rows (one per app, yielded lazily):
     [{collection_timestamp, date_range_days, app_key, app_name, android, ios, google_play_vitals}, ...]
     """
-    rows = []
-    collection_timestamp = json_data.get('timestamp')
-    date_range_days = json_data.get('date_range_days', 7)
-    
-    apps = json_data.get('apps', {})
-    
-    # App name mapping (since app_name is not in the output JSON)
-    app_name_map = {
-        'partner': 'Partner App',
-        'customer': 'Customer App',
-        'vendor': 'Vendor App',
-        'owner': 'Owner App'
-    }
-    
-    for app_key, app_data in apps.items():
+    return transform_apps_to_bigquery_rows(
+        json_data.get('apps', {}).items(),
+        json_data.get('timestamp'),
+        json_data.get('date_range_days', 7)
+    )
+
+
+def transform_apps_to_bigquery_rows(
+    apps_items,
+    collection_timestamp: str | None,
+    date_range_days: int
+) -> Iterator[Dict[str, Any]]:
+    """
+    Transform (app_key, app_data) pairs to BigQuery rows, yielded one at a time
+    apps_items can be any iterable, e.g. a streaming parser yielding one app at a time
+    """
+    for app_key, app_data in apps_items:
         # Skip apps with errors
-        if isinstance(app_data, dict) and 'error' in app_data:
-            print(f"⚠️  Skipping {app_key} due to error: {app_data['error']}")
+        error = app_data.get('error', _NO_ERROR) if hasattr(app_data, 'get') else _NO_ERROR
+        if error is not _NO_ERROR:
+            print(f"⚠️  Skipping {app_key} due to error: {error}")
             continue
         
+        yield build_row(app_key, app_data, collection_timestamp, date_range_days)
+
+
+def build_row(
+    app_key: str,
+    app_data: Dict[str, Any],
+    collection_timestamp: str | None,
+    date_range_days: int
+) -> Dict[str, Any]:
+    """Build one BigQuery row for an app, with every schema field spelled out"""
+    android = app_data.get('android')
+    ios = app_data.get('ios')
+    vitals = app_data.get('google_play_vitals')
+    return {
+        'collection_timestamp': collection_timestamp,
+        'date_range_days': date_range_days,
+        'app_key': app_key,
         # Get app name from mapping or use capitalized app_key
-        app_name = app_data.get('app_name') or app_name_map.get(app_key) or app_key.capitalize()
-        
+        'app_name': app_data.get('app_name') or _APP_NAMES.get(app_key) or app_key.capitalize(),
         # Normalize Android and iOS data to ensure schema compliance
-        android_data = normalize_android_data(app_data.get('android', {}))
-        ios_data = normalize_ios_data(app_data.get('ios', {}))
-        
-        # Transform Google Play Vitals
-        google_play_vitals = transform_google_play_vitals(
-            app_data.get('google_play_vitals')
+        'android': normalize_android_data(android) if android else {},
+        'ios': normalize_ios_data(ios) if ios else {},
+        'google_play_vitals': transform_google_play_vitals(vitals) if vitals else None
+    }
+
+
+def _build_descriptor(name: str, schema, scope: str) -> "descriptor_pb2.DescriptorProto":
+    """Build a self-contained proto2 message descriptor for a BigQuery schema (records become nested types)"""
+    message = descriptor_pb2.DescriptorProto(name=name)
+    for number, field in enumerate(schema, start=1):
+        proto_field = message.field.add(name=field.name, number=number)
+        proto_field.label = (descriptor_pb2.FieldDescriptorProto.LABEL_REPEATED if field.mode == 'REPEATED'
+                             else descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL)
+        if field.field_type in ('RECORD', 'STRUCT'):
+            nested_name = ''.join(part.capitalize() for part in field.name.split('_')) + 'Record'
+            message.nested_type.append(_build_descriptor(nested_name, field.fields, f"{scope}.{name}"))
+            proto_field.type = descriptor_pb2.FieldDescriptorProto.TYPE_MESSAGE
+            proto_field.type_name = f"{scope}.{name}.{nested_name}"
+        else:
+            # NUMERIC, DATETIME, JSON etc. are sent as strings (see _to_proto_value)
+            proto_field.type = descriptor_pb2.FieldDescriptorProto.Type.Value(
+                _PROTO_TYPES.get(field.field_type, 'TYPE_STRING'))
+    return message
+
+
+@lru_cache(maxsize=None)
+def _row_message_class(schema: tuple):
+    """Descriptor and message class for a table schema, built once per schema"""
+    descriptor_proto = _build_descriptor('Row', schema, '')
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name='export_to_bigquery_row.proto', syntax='proto2', message_type=[descriptor_proto])
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+    descriptor = pool.FindMessageTypeByName('Row')
+    if hasattr(message_factory, 'GetMessageClass'):
+        message_class = message_factory.GetMessageClass(descriptor)
+    else:
+        message_class = message_factory.MessageFactory(pool).GetPrototype(descriptor)
+    return descriptor_proto, message_class
+
+
+def _to_proto_value(field, value):
+    """Convert a JSON row value to what the proto field expects"""
+    if field.field_type == 'TIMESTAMP':
+        timestamp = datetime.fromisoformat(value)
+        if timestamp.tzinfo is None:
+            # Same as insert_rows_json: naive timestamps are UTC
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return (timestamp - _EPOCH) // _MICROSECOND
+    if field.field_type == 'DATE':
+        return date.fromisoformat(value[:10]).toordinal() - _EPOCH_ORDINAL
+    if field.field_type in ('RECORD', 'STRUCT'):
+        return _to_proto_dict(field.fields, value)
+    if field.field_type == 'JSON':
+        return json.dumps(value)
+    if field.field_type in _STRING_ENCODED_TYPES:
+        return str(value)
+    return value
+
+
+def _unknown_fields(schema, row: Dict[str, Any], prefix: str = '') -> Iterator[str]:
+    """Yield the paths of row fields that are not in the table schema"""
+    fields = {field.name: field for field in schema}
+    for name, value in row.items():
+        field = fields.get(name)
+        if field is None:
+            yield prefix + name
+        elif value is not None and field.field_type in ('RECORD', 'STRUCT'):
+            for item in (value if field.mode == 'REPEATED' else (value,)):
+                if item is not None:
+                    yield from _unknown_fields(field.fields, item, f"{prefix}{name}.")
+
+
+def _to_proto_dict(schema, row: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a JSON row to a dict json_format can parse into the row message (None values dropped)"""
+    converted = {}
+    for field in schema:
+        value = row.get(field.name)
+        if value is None:
+            continue
+        if field.mode == 'REPEATED':
+            converted[field.name] = [_to_proto_value(field, item) for item in value if item is not None]
+        else:
+            converted[field.name] = _to_proto_value(field, value)
+    return converted
+
+
+def append_rows_storage_write(
+    project_id: str,
+    dataset_id: str,
+    table_id: str,
+    table,
+    row_batches: Iterable[List[Dict[str, Any]]],
+    credentials=None
+) -> List[Any]:
+    """Append row batches to the table's default stream with the Storage Write API, returning any errors"""
+    descriptor_proto, message_class = _row_message_class(tuple(table.schema))
+
+    write_client = bigquery_storage_v1.BigQueryWriteClient(credentials=credentials)
+    parent = write_client.table_path(project_id, dataset_id, table_id)
+
+    # The writer schema is sent once, on the first request of the connection
+    request_template = storage_types.AppendRowsRequest(write_stream=f"{parent}/streams/_default")
+    proto_data = storage_types.AppendRowsRequest.ProtoData()
+    proto_data.writer_schema = storage_types.ProtoSchema(proto_descriptor=descriptor_proto)
+    request_template.proto_data = proto_data
+    append_rows_stream = storage_writer.AppendRowsStream(write_client, request_template)
+
+    errors = []
+    futures = []
+
+    def send(serialized_rows):
+        request = storage_types.AppendRowsRequest()
+        request_data = storage_types.AppendRowsRequest.ProtoData()
+        request_data.rows = storage_types.ProtoRows(serialized_rows=serialized_rows)
+        request.proto_data = request_data
+        futures.append(append_rows_stream.send(request))
+
+    try:
+        for rows in row_batches:
+            # One request per batch, split further if it would exceed the byte limit
+            batch = []
+            batch_bytes = 0
+            for row in rows:
+                # Rejected like insert_rows_json would, instead of silently dropping the extra fields
+                unknown = list(_unknown_fields(table.schema, row))
+                if unknown:
+                    errors.append(f"{row.get('app_key')}: no such field: {', '.join(unknown)}")
+                    continue
+                try:
+                    message = json_format.ParseDict(_to_proto_dict(table.schema, row), message_class())
+                except json_format.ParseError as e:
+                    errors.append(f"{row.get('app_key')}: {e}")
+                    continue
+                serialized = message.SerializeToString()
+                if batch and batch_bytes + len(serialized) > APPEND_BATCH_BYTES:
+                    send(batch)
+                    batch, batch_bytes = [], 0
+                batch.append(serialized)
+                batch_bytes += len(serialized)
+            if batch:
+                send(batch)
+
+        for future in futures:
+            try:
+                response = future.result()
+                errors.extend(response.row_errors)
+            except Exception as e:
+                errors.append(e)
+    finally:
+        append_rows_stream.close()
+
+    return errors
+
+
+def _dumps_line(row: Dict[str, Any]) -> bytes:
+    """One NDJSON line for a row"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(row) + b"\n"
+    return json.dumps(row).encode() + b"\n"
+
+
+def load_rows_ndjson(client, table, row_batches: Iterable[List[Dict[str, Any]]]) -> List[Any]:
+    """Append row batches to the table with one gzipped newline-delimited JSON load job, returning any errors"""
+    # Spooled: stays in memory for typical runs, spills to disk past NDJSON_SPOOL_BYTES
+    # ('rb+' rather than the default 'w+b': load_table_from_file rejects other modes)
+    with tempfile.SpooledTemporaryFile(max_size=NDJSON_SPOOL_BYTES, mode='rb+') as ndjson:
+        # Level 1: the repeated field names compress well even at the cheapest setting
+        with gzip.GzipFile(fileobj=ndjson, mode='wb', compresslevel=1) as gz:
+            for rows in row_batches:
+                for row in rows:
+                    gz.write(_dumps_line(row))
+        ndjson.seek(0)
+        # Load jobs detect gzip input themselves (LoadJobConfig has no compression setting)
+        job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND
         )
-        
-        row = {
-            'collection_timestamp': collection_timestamp,
-            'date_range_days': date_range_days,
-            'app_key': app_key,
-            'app_name': app_name,
-            'android': android_data,
-            'ios': ios_data,
-            'google_play_vitals': google_play_vitals
-        }
-        
-        rows.append(row)
-    
-    return rows
+        job = client.load_table_from_file(ndjson, table, job_config=job_config)
+        try:
+            job.result()
+        except Exception as e:
+            return job.errors or [e]
+        return job.errors or []
+
+
+@lru_cache(maxsize=32)
+def _get_credentials(credentials_path: str | None):
+    """Service account credentials for a key file, or None for application default credentials"""
+    if not credentials_path:
+        return None
+    return service_account.Credentials.from_service_account_file(
+        credentials_path,
+        scopes=["https://www.googleapis.com/auth/bigquery"]
+    )
+
+
+@lru_cache(maxsize=32)
+def _get_client(project_id: str, credentials_path: str | None):
+    """BigQuery client per project and credentials file"""
+    credentials = _get_credentials(credentials_path)
+    if credentials:
+        return bigquery.Client(project=project_id, credentials=credentials)
+    return bigquery.Client(project=project_id)
+
+
+@lru_cache(maxsize=32)
+def _get_table(client, dataset_id: str, table_id: str):
+    """Table metadata (including schema), fetched once per table"""
+    table_ref = client.dataset(dataset_id).table(table_id)
+    return client.get_table(table_ref)
 
 
 def export_to_bigquery(
@@ -143,45 +445,76 @@ def export_to_bigquery(
     project_id: str,
     dataset_id: str,
     table_id: str,
-    credentials_path: str | None = None
+    credentials_path: str | None = None,
+    refresh_schema: bool = False,
+    backend: str | None = None
 ):
-    """Export JSON file to BigQuery"""
+    """
+    Export JSON file to BigQuery
+    backend is one of BACKENDS; None means Storage Write when installed, else a load job
+    """
     if not BIGQUERY_AVAILABLE:
         print("❌ BigQuery client not available")
         sys.exit(1)
+    if backend is None:
+        backend = 'storage-write' if STORAGE_WRITE_AVAILABLE else 'load-job'
+    elif backend not in BACKENDS:
+        print(f"❌ Unknown backend: {backend} (expected one of {', '.join(BACKENDS)})")
+        sys.exit(1)
+    if backend == 'storage-write' and not STORAGE_WRITE_AVAILABLE:
+        print("❌ Storage Write backend not available. Install with: pip install google-cloud-bigquery-storage")
+        sys.exit(1)
     
-    # Load JSON data
+    # Load JSON data and transform to BigQuery rows (lazily, consumed while uploading)
     print(f"📄 Loading JSON from {json_file_path}...")
-    with open(json_file_path, 'r') as f:
-        json_data = json.load(f)
-    
-    # Transform to BigQuery rows
-    print("🔄 Transforming data to BigQuery format...")
-    rows = transform_json_to_bigquery_rows(json_data)
-    
-    if not rows:
-        print("⚠️  No data to export")
-        return
-    
-    print(f"✅ Prepared {len(rows)} rows for export")
-    
-    # Initialize BigQuery client
-    if credentials_path:
-        credentials = service_account.Credentials.from_service_account_file(
-            credentials_path,
-            scopes=["https://www.googleapis.com/auth/bigquery"]
-        )
-        client = bigquery.Client(project=project_id, credentials=credentials)
-    else:
-        client = bigquery.Client(project=project_id)
-    
-    # Get table reference
-    table_ref = client.dataset(dataset_id).table(table_id)
-    table = client.get_table(table_ref)
-    
-    # Insert rows
-    print(f"📤 Uploading to BigQuery: {project_id}.{dataset_id}.{table_id}...")
-    errors = client.insert_rows_json(table, rows)
+    with open(json_file_path, 'rb') as f:
+        if IJSON_AVAILABLE:
+            # Stream the apps one at a time instead of holding the whole document
+            print("🔄 Transforming data to BigQuery format (streaming)...")
+            collection_timestamp = next(ijson.items(f, 'timestamp'), None)
+            f.seek(0)
+            date_range_days = next(ijson.items(f, 'date_range_days'), 7)
+            f.seek(0)
+            rows = transform_apps_to_bigquery_rows(
+                ijson.kvitems(f, 'apps', use_float=True),
+                collection_timestamp,
+                date_range_days
+            )
+        else:
+            json_data = orjson.loads(f.read()) if ORJSON_AVAILABLE else json.load(f)
+            collection_timestamp = json_data.get('timestamp')
+
+            print("🔄 Transforming data to BigQuery format...")
+            rows = transform_json_to_bigquery_rows(json_data)
+        
+        first_batch = list(islice(rows, BATCH_SIZE))
+        if not first_batch:
+            print("⚠️  No data to export")
+            return
+        
+        # Initialize BigQuery client and table (reused across calls in the same process)
+        credentials = _get_credentials(credentials_path)
+        client = _get_client(project_id, credentials_path)
+        if refresh_schema:
+            _get_table.cache_clear()
+        table = _get_table(client, dataset_id, table_id)
+        
+        exported_app_keys = []
+
+        def row_batches():
+            batch = first_batch
+            while batch:
+                exported_app_keys.extend(row['app_key'] for row in batch)
+                yield batch
+                batch = list(islice(rows, BATCH_SIZE))
+        
+        print(f"📤 Uploading to BigQuery: {project_id}.{dataset_id}.{table_id} ({backend})...")
+        if backend == 'storage-write':
+            # Binary protobuf rows over gRPC
+            errors = append_rows_storage_write(project_id, dataset_id, table_id, table, row_batches(), credentials)
+        else:
+            # One batch load job (no streaming-insert quota or per-row cost)
+            errors = load_rows_ndjson(client, table, row_batches())
     
     if errors:
         print(f"❌ Errors occurred while inserting rows:")
@@ -189,9 +522,9 @@ def export_to_bigquery(
             print(f"   {error}")
         sys.exit(1)
     else:
-        print(f"✅ Successfully exported {len(rows)} rows to BigQuery!")
-        print(f"   Collection timestamp: {json_data.get('timestamp')}")
-        print(f"   Apps exported: {', '.join([r['app_key'] for r in rows])}")
+        print(f"✅ Successfully exported {len(exported_app_keys)} rows to BigQuery!")
+        print(f"   Collection timestamp: {collection_timestamp}")
+        print(f"   Apps exported: {', '.join(exported_app_keys)}")
 
 
 if __name__ == "__main__":
@@ -205,6 +538,11 @@ if __name__ == "__main__":
     parser.add_argument('--dataset', required=True, help='BigQuery Dataset ID')
     parser.add_argument('--table', required=True, help='BigQuery Table ID')
     parser.add_argument('--credentials', help='Path to service account JSON file')
+    parser.add_argument('--refresh-schema', action='store_true',
+                        help='Re-fetch the table schema instead of using the cached one')
+    parser.add_argument('--backend', choices=BACKENDS, default=os.getenv('BIGQUERY_WRITE_BACKEND') or None,
+                        help='Upload backend (default: $BIGQUERY_WRITE_BACKEND, else storage-write when '
+                             'google-cloud-bigquery-storage is installed, else load-job)')
     
     args = parser.parse_args()
     
@@ -213,6 +551,8 @@ if __name__ == "__main__":
         args.project,
         args.dataset,
         args.table,
-        args.credentials
+        args.credentials,
+        args.refresh_schema,
+        args.backend
     )
 
@@ -4,14 +4,96 @@
 import asyncio
 import os
 import json
+import re
 from pathlib import Path
 from browser_use import Browser
+from browser_daemon import send_command
+
+FIREBASE_CONSOLE_URL = "https://console.firebase.google.com"
+
+# SSO/login redirects (jumpcloud.com also covers sso.jumpcloud.com)
+_SSO_RE = re.compile(r'jumpcloud\.com|/login|accounts\.google\.com/(?:v3/)?signin', re.IGNORECASE)
+
+
+def confirm_authenticated(current_url: str) -> bool:
+    """Warn if the browser is still on a login/SSO page; returns False if the user cancels"""
+    print(f"\n🔍 Current URL: {current_url}")
+    is_sso_redirect = _SSO_RE.search(current_url) is not None
+    
+    if is_sso_redirect:
+        print("⚠️  Warning: Still on login/SSO page!")
+        print(f"   Detected: {current_url}")
+        response = input("Continue anyway? (y/n): ").strip().lower()
+        if response != 'y':
+            print("❌ Cancelled. Please login and run the script again.")
+            return False
+    else:
+        print("✅ Appears to be authenticated (not on login page)")
+    return True
+
+
+def print_saved(storage_path: Path, user_data_dir: str):
+    size = storage_path.stat().st_size
+    print(f"\n✅ Browser session saved!")
+    print(f"   Local session: {user_data_dir} (automatically managed by browser_use)")
+    print(f"   Export file: {storage_path} ({size} bytes)")
+    print("\n📦 Next steps:")
+    print("   1. git add browser_state/storage_state.json")
+    print("   2. git commit -m 'Update browser session'")
+    print("   3. git push")
+    print("   4. Trigger GitHub Actions workflow rerun (if needed)")
+    print("\n   Note: The user_data_dir session is used by automate_vitals.py locally.")
+    print("   The storage_state.json file is for GitHub Actions (if you switch to Playwright).")
+
+
+async def save_session_via_daemon(user_data_dir: str, storage_path: str):
+    """Same flow as save_session, driving the already-running browser_daemon.py browser"""
+    print("🔌 Using running browser daemon (skipping browser start)...")
+    print("📝 Please complete SSO login, then press Enter here when done.")
+    print(f"\n💾 Session will be saved to: {user_data_dir}")
+    print(f"   And exported to: {storage_path} for GitHub Actions")
+    
+    print("\n🌐 Navigating to Firebase Console...")
+    reply = await send_command({"op": "goto", "url": FIREBASE_CONSOLE_URL})
+    if reply["ok"]:
+        print("✅ Page loaded (waiting for you to complete login)...")
+    else:
+        print(f"⚠️  Navigation warning: {reply['error']}")
+        print("   Continuing anyway - you can still login...")
+    
+    print("\n" + "="*60)
+    print("📝 Please complete SSO login in the browser window")
+    print("   Once you're logged into Firebase Console, come back here")
+    input("✅ Press Enter after completing SSO login and ensuring you're on Firebase Console...")
+    
+    reply = await send_command({"op": "current_url"})
+    if not confirm_authenticated(reply.get("url", "")):
+        return
+    
+    reply = await send_command({"op": "save_storage", "path": os.path.abspath(storage_path)})
+    if reply["ok"]:
+        print_saved(Path(storage_path), user_data_dir)
+    else:
+        print(f"\n⚠️  Could not export storage state: {reply['error']}")
+        print(f"   Session is still saved to: {user_data_dir}")
+        print("   This is fine - browser_use will use this directory automatically.")
+
 
 async def save_session():
     # Use the same user_data_dir as automate_vitals.py
     user_data_dir = os.path.expanduser("~/.browser_use_firebase")
     storage_path = 'browser_state/storage_state.json'
     
+    # Reuse the browser daemon's browser if one is running
+    try:
+        await send_command({"op": "ping"})
+    except OSError:
+        # No daemon running (or no Unix sockets here): launch a browser of our own
+        pass
+    else:
+        await save_session_via_daemon(user_data_dir, storage_path)
+        return
+    
     print("🌐 Opening browser for manual login...")
     print("📝 Please complete SSO login, then press Enter here when done.")
     print("   Make sure you're logged into Firebase Console before pressing Enter.")
@@ -29,7 +111,7 @@ async def save_session():
         await browser.start()
         
         # Navigate to initialize and get a page
-        await browser.navigate_to("https://console.firebase.google.com")
+        await browser.navigate_to(FIREBASE_CONSOLE_URL)
         page = await browser.get_current_page()
         
         if page is None:
@@ -38,7 +120,7 @@ async def save_session():
         # Navigate to Firebase Console (already done, but ensure page is ready)
         print("\n🌐 Navigating to Firebase Console...")
         try:
-            await page.goto("https://console.firebase.google.com", wait_until="domcontentloaded", timeout=30000)
+            await page.goto(FIREBASE_CONSOLE_URL, wait_until="domcontentloaded", timeout=30000)
             print("✅ Page loaded (waiting for you to complete login)...")
         except Exception as e:
             print(f"⚠️  Navigation warning: {e}")
@@ -51,29 +133,8 @@ async def save_session():
         input("✅ Press Enter after completing SSO login and ensuring you're on Firebase Console...")
         
         # Verify we're authenticated
-        current_url = page.url
-        print(f"\n🔍 Current URL: {current_url}")
-        
-        # Check for SSO/login redirects
-        sso_patterns = [
-            'jumpcloud.com',
-            'sso.jumpcloud.com',
-            '/login',
-            'accounts.google.com/v3/signin',
-            'accounts.google.com/signin'
-        ]
-        
-        is_sso_redirect = any(pattern in current_url.lower() for pattern in sso_patterns)
-        
-        if is_sso_redirect:
-            print("⚠️  Warning: Still on login/SSO page!")
-            print(f"   Detected: {current_url}")
-            response = input("Continue anyway? (y/n): ").strip().lower()
-            if response != 'y':
-                print("❌ Cancelled. Please login and run the script again.")
-                return
-        else:
-            print("✅ Appears to be authenticated (not on login page)")
+        if not confirm_authenticated(page.url):
+            return
         
         # Save storage state using browser_use's built-in method
         try:
@@ -84,16 +145,7 @@ async def save_session():
             # Use browser_use's save_storage_state method
             await browser.save_storage_state(storage_path_obj)
             
-            print(f"\n✅ Browser session saved!")
-            print(f"   Local session: {user_data_dir} (automatically managed by browser_use)")
-            print(f"   Export file: {storage_path} ({os.path.getsize(storage_path)} bytes)")
-            print("\n📦 Next steps:")
-            print("   1. git add browser_state/storage_state.json")
-            print("   2. git commit -m 'Update browser session'")
-            print("   3. git push")
-            print("   4. Trigger GitHub Actions workflow rerun (if needed)")
-            print("\n   Note: The user_data_dir session is used by automate_vitals.py locally.")
-            print("   The storage_state.json file is for GitHub Actions (if you switch to Playwright).")
+            print_saved(storage_path_obj, user_data_dir)
         except Exception as e:
             print(f"\n⚠️  Could not export storage state: {e}")
             print(f"   Error type: {type(e).__name__}")